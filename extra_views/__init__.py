@@ -1,4 +1,6 @@
 from extra_views.advanced import (
+    AsyncCreateWithInlinesView,
+    AsyncUpdateWithInlinesView,
     CreateWithInlinesView,
     FormSetSuccessMessageMixin,
     InlineFormSetFactory,
@@ -8,11 +10,20 @@ from extra_views.advanced import (
 )
 from extra_views.contrib.mixins import SearchableListMixin, SortableListMixin
 from extra_views.dates import CalendarMonthView
-from extra_views.formsets import FormSetView, InlineFormSetView, ModelFormSetView
+from extra_views.formsets import (
+    AsyncFormSetView,
+    AsyncInlineFormSetView,
+    AsyncModelFormSetView,
+    FormSetView,
+    InlineFormSetView,
+    ModelFormSetView,
+)
 
 __version__ = "0.16.0"
 
 __all__ = [
+    "AsyncCreateWithInlinesView",
+    "AsyncUpdateWithInlinesView",
     "CreateWithInlinesView",
     "FormSetSuccessMessageMixin",
     "InlineFormSetFactory",
@@ -22,6 +33,9 @@ __all__ = [
     "SearchableListMixin",
     "SortableListMixin",
     "CalendarMonthView",
+    "AsyncFormSetView",
+    "AsyncInlineFormSetView",
+    "AsyncModelFormSetView",
     "FormSetView",
     "InlineFormSetView",
     "ModelFormSetView",
@@ -1,10 +1,36 @@
 from django.contrib import messages
+from django.db import router, transaction
 from django.forms.formsets import all_valid
+from django.http import Http404
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import gettext as _
 from django.views.generic.base import ContextMixin
 from django.views.generic.detail import SingleObjectTemplateResponseMixin
 from django.views.generic.edit import FormView, ModelFormMixin
 
-from extra_views.formsets import BaseInlineFormSetFactory
+from extra_views.formset_mixins import run_on_worker
+from extra_views.formsets import (
+    AsyncSingleObjectMixin,
+    BaseInlineFormSetFactory,
+    ConditionalGetMixin,
+    PartialRenderMixin,
+    bulk_save_formsets,
+)
+
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:  # Django < 3.0, which doesn't support async views.
+    sync_to_async = None
+
+
+def is_lazy_formset(formset):
+    """
+    Returns whether `formset` is the formset of a lazy inline, which isn't built yet
+    or was built on first use.
+    """
+    # isinstance() checks the type of the proxy before its __class__, so it doesn't
+    # build the formset.
+    return isinstance(formset, SimpleLazyObject)
 
 
 class InlineFormSetFactory(BaseInlineFormSetFactory):
@@ -32,6 +58,27 @@ class InlineFormSetFactory(BaseInlineFormSetFactory):
         formset.model = self.inline_model
         return formset
 
+    def get_prefetched_queryset(self):
+        """
+        Returns the related instances of the object if the view prefetched them with
+        it because its `prefetch_inlines` is set, or `None`.
+        """
+        if "_prefetched_queryset" in self.__dict__:
+            return self._prefetched_queryset
+        self._prefetched_queryset = None
+        instance = self.object
+        if (
+            getattr(self.view, "prefetch_inlines", False)
+            and instance is not None
+            and instance.pk is not None
+            and self.get_prefetch() is not None
+        ):
+            queryset = getattr(instance, self.get_related_name()).all()
+            # The queryset is only evaluated if it was taken from the prefetch cache.
+            if queryset._result_cache is not None:
+                self._prefetched_queryset = queryset
+        return self._prefetched_queryset
+
 
 class ModelFormWithInlinesMixin(ModelFormMixin):
     """
@@ -42,6 +89,9 @@ class ModelFormWithInlinesMixin(ModelFormMixin):
     """
 
     inlines = []
+    prefetch_inlines = False
+    bulk_save = False
+    inline_executor = None
 
     def get_inlines(self):
         """
@@ -49,13 +99,62 @@ class ModelFormWithInlinesMixin(ModelFormMixin):
         """
         return self.inlines[:]
 
+    def get_queryset(self):
+        """
+        Returns the queryset of the object, which prefetches the instances of the
+        inlines if `prefetch_inlines` is set.
+        """
+        queryset = super().get_queryset()
+        if self.prefetch_inlines:
+            queryset = queryset.prefetch_related(
+                *self.get_inline_prefetches(queryset.model)
+            )
+        return queryset
+
+    def get_inline_prefetches(self, model):
+        """
+        Returns the `Prefetch` objects that load the instances of the inlines along
+        with an instance of `model`.
+        """
+        prefetches = []
+        for inline_class in self.get_inlines():
+            inline_instance = inline_class(model, self.request, None, self.kwargs, self)
+            prefetch = inline_instance.get_prefetch()
+            if prefetch is not None:
+                prefetches.append(prefetch)
+        return prefetches
+
+    def get_conditional_models(self):
+        """
+        Returns the models whose changes change the ETag of the view.
+        """
+        models = super().get_conditional_models()
+        return models + [inline.model for inline in self.get_inlines()]
+
     def forms_valid(self, form, inlines):
         """
-        If the form and formsets are valid, save the associated models.
+        If the form and formsets are valid, save the associated models in a single
+        transaction, with `bulk_save_formsets()` for the inlines if `bulk_save` is
+        set.
+
+        The inlines with a `version_field` first claim the versions of their
+        instances. If some were changed by someone else, nothing is saved and the
+        forms are rendered again with the errors.
         """
-        response = self.form_valid(form)
-        for formset in inlines:
-            formset.save()
+        using = router.db_for_write(type(form.instance))
+        with transaction.atomic(using=using):
+            versioned = [
+                formset for formset in inlines if hasattr(formset, "claim_versions")
+            ]
+            if not all([formset.claim_versions() for formset in versioned]):
+                transaction.set_rollback(True, using=using)
+                return self.forms_invalid(form, inlines)
+            response = self.form_valid(form)
+            if self.bulk_save:
+                bulk_save_formsets(inlines)
+            else:
+                for formset in inlines:
+                    formset.save()
         return response
 
     def forms_invalid(self, form, inlines):
@@ -67,21 +166,69 @@ class ModelFormWithInlinesMixin(ModelFormMixin):
             self.get_context_data(form=form, inlines=inlines)
         )
 
+    def get_inline_executor(self):
+        """
+        Returns the `concurrent.futures.Executor` on which the inline formsets are
+        built and validated, or `None` to build them one after the other.
+        """
+        return self.inline_executor
+
     def construct_inlines(self):
         """
         Returns the inline formset instances
         """
-        inline_formsets = []
+        inline_classes = self.get_inlines()
+        executor = self.get_inline_executor()
+        if executor is None:
+            return [
+                self.construct_inline(inline_class) for inline_class in inline_classes
+            ]
+        # map() returns the formsets in the order of the inlines.
+        return list(
+            executor.map(run_on_worker(self.construct_inline_on_worker), inline_classes)
+        )
+
+    def construct_inline(self, inline_class):
+        """
+        Returns the formset instance of the inline `inline_class`.
+
+        The formset of a `lazy` inline that wasn't submitted is only built when it
+        is first used, for example when the template renders it.
+        """
+        inline_instance = inline_class(
+            self.model, self.request, self.object, self.kwargs, self
+        )
+        if inline_instance.lazy and not inline_instance.is_submitted():
+            return SimpleLazyObject(inline_instance.construct_formset)
+        return inline_instance.construct_formset()
+
+    def construct_partial_formset(self, prefix):
+        """
+        Returns the formset of the inline with the prefix `prefix`, without building
+        the form and the other inlines.
+        """
         for inline_class in self.get_inlines():
             inline_instance = inline_class(
                 self.model, self.request, self.object, self.kwargs, self
             )
-            inline_formset = inline_instance.construct_formset()
-            inline_formsets.append(inline_formset)
-        return inline_formsets
+            if inline_instance.get_formset_prefix() == prefix:
+                return self.construct_inline(inline_class)
+        raise Http404(_("No inline with the prefix %(prefix)s") % {"prefix": prefix})
 
+    def construct_inline_on_worker(self, inline_class):
+        """
+        Returns the formset instance of the inline `inline_class`, built on a worker
+        of the executor and validated there if it is bound.
 
-class ProcessFormWithInlinesView(FormView):
+        It runs with the timezone and language of the request, see `run_on_worker`.
+        """
+        formset = self.construct_inline(inline_class)
+        if not is_lazy_formset(formset) and formset.is_bound:
+            formset.is_valid()
+        return formset
+
+
+class ProcessFormWithInlinesView(ConditionalGetMixin, PartialRenderMixin, FormView):
     """
     A mixin that renders a form and inline formsets on GET and processes it on POST.
     """
@@ -90,6 +237,9 @@ class ProcessFormWithInlinesView(FormView):
         """
         Handles GET requests and instantiates a blank version of the form and formsets.
         """
+        prefix = self.get_partial_prefix()
+        if prefix is not None:
+            return self.render_partial_response(prefix)
         form_class = self.get_form_class()
         form = self.get_form(form_class)
         inlines = self.construct_inlines()
@@ -102,6 +252,9 @@ class ProcessFormWithInlinesView(FormView):
         Handles POST requests, instantiating a form and formset instances with the
         passed POST variables and then checked for validity.
         """
+        prefix = self.get_partial_prefix()
+        if prefix is not None:
+            return self.render_partial_response(prefix)
         form_class = self.get_form_class()
         form = self.get_form(form_class)
 
@@ -113,9 +266,11 @@ class ProcessFormWithInlinesView(FormView):
             form_validated = False
 
         inlines = self.construct_inlines()
+        # The lazy inlines that weren't submitted are neither validated nor saved.
+        submitted = [formset for formset in inlines if not is_lazy_formset(formset)]
 
-        if all_valid(inlines) and form_validated:
-            return self.forms_valid(form, inlines)
+        if all_valid(submitted) and form_validated:
+            return self.forms_valid(form, submitted)
         self.object = initial_object
         return self.forms_invalid(form, inlines)
 
@@ -125,6 +280,24 @@ class ProcessFormWithInlinesView(FormView):
         return self.post(*args, **kwargs)
 
 
+class AsyncProcessFormWithInlinesView(ProcessFormWithInlinesView):
+    """
+    An async version of `ProcessFormWithInlinesView`, for projects served with ASGI.
+
+    Requires Django 4.1 or later. Django forms have no async API, so the form and
+    formsets are built, validated and saved in a single call to a worker thread.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return await sync_to_async(super().get)(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        return await sync_to_async(super().post)(request, *args, **kwargs)
+
+    async def put(self, *args, **kwargs):
+        return await self.post(*args, **kwargs)
+
+
 class BaseCreateWithInlinesView(ModelFormWithInlinesMixin, ProcessFormWithInlinesView):
     """
     Base view for creating an new object instance with related model instances.
@@ -179,6 +352,60 @@ class UpdateWithInlinesView(
     template_name_suffix = "_form"
 
 
+class AsyncBaseCreateWithInlinesView(
+    ModelFormWithInlinesMixin, AsyncProcessFormWithInlinesView
+):
+    """
+    An async version of `BaseCreateWithInlinesView`.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object = None
+        return await super().get(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        self.object = None
+        return await super().post(request, *args, **kwargs)
+
+
+class AsyncCreateWithInlinesView(
+    SingleObjectTemplateResponseMixin, AsyncBaseCreateWithInlinesView
+):
+    """
+    Async view for creating a new object instance with related model instances,
+    with a response rendered by template.
+    """
+
+    template_name_suffix = "_form"
+
+
+class AsyncBaseUpdateWithInlinesView(
+    AsyncSingleObjectMixin, ModelFormWithInlinesMixin, AsyncProcessFormWithInlinesView
+):
+    """
+    An async version of `BaseUpdateWithInlinesView`.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return await super().get(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return await super().post(request, *args, **kwargs)
+
+
+class AsyncUpdateWithInlinesView(
+    SingleObjectTemplateResponseMixin, AsyncBaseUpdateWithInlinesView
+):
+    """
+    Async view for updating an object with related model instances,
+    with a response rendered by template.
+    """
+
+    template_name_suffix = "_form"
+
+
 class NamedFormsetsMixin(ContextMixin):
     """
     A mixin for use with `CreateWithInlinesView` or `UpdateWithInlinesView` that lets
@@ -14,6 +14,8 @@ from django.views.generic.dates import (
 )
 from django.views.generic.list import BaseListView, MultipleObjectTemplateResponseMixin
 
+from extra_views.formsets import ConditionalGetMixin
+
 DAYS = (
     _("Monday"),
     _("Tuesday"),
@@ -33,7 +35,9 @@ def daterange(start_date, end_date):
         yield start_date + datetime.timedelta(n)
 
 
-class BaseCalendarMonthView(DateMixin, YearMixin, MonthMixin, BaseListView):
+class BaseCalendarMonthView(
+    ConditionalGetMixin, DateMixin, YearMixin, MonthMixin, BaseListView
+):
     """
     A base view for displaying a calendar month
     """
@@ -54,6 +58,19 @@ class BaseCalendarMonthView(DateMixin, YearMixin, MonthMixin, BaseListView):
     def get_allow_future(self):
         return True
 
+    def get_today(self):
+        """
+        Returns the date marked as `today` in the calendar, in UTC.
+        """
+        return datetime.datetime.now(datetime.timezone.utc).date()
+
+    def get_conditional_scope(self):
+        """
+        Adds the date marked as `today` to the parts of the ETag that depend on the
+        request, so that the calendar changes with the day.
+        """
+        return super().get_conditional_scope() + [self.get_today().isoformat()]
+
     def get_end_date_field(self):
         """
         Returns the model field to use for end dates
@@ -183,7 +200,7 @@ class BaseCalendarMonthView(DateMixin, YearMixin, MonthMixin, BaseListView):
         cal = Calendar(self.get_first_of_week())
 
         month_calendar = []
-        now = datetime.datetime.now(datetime.timezone.utc)
+        today = self.get_today()
 
         date_lists = defaultdict(list)
         multidate_objs = []
@@ -245,7 +262,7 @@ class BaseCalendarMonthView(DateMixin, YearMixin, MonthMixin, BaseListView):
                     {
                         "day": day,
                         "events": date_lists[day],
-                        "today": day == now.date(),
+                        "today": day == today,
                         "is_current_month": day.month == date.month,
                     }
                 )
@@ -0,0 +1,913 @@
+import copy
+import functools
+import itertools
+import json
+import operator
+import threading
+from collections.abc import MutableMapping
+
+from django.core.exceptions import NON_FIELD_ERRORS, EmptyResultSet, ValidationError
+from django.db import close_old_connections, router, transaction
+from django.db.models import DateTimeField, F, Q
+from django.forms import (
+    CharField,
+    DecimalField,
+    FileField,
+    FloatField,
+    HiddenInput,
+    IntegerField,
+)
+from django.forms.forms import BaseForm
+from django.forms.formsets import BaseFormSet
+from django.forms.models import (
+    BaseModelForm,
+    BaseModelFormSet,
+    ModelChoiceField,
+    ModelChoiceIterator,
+    ModelMultipleChoiceField,
+)
+from django.utils import timezone, translation
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext as _
+
+FINGERPRINT_FIELD_NAME = "FINGERPRINT"
+VERSION_FIELD_NAME = "VERSION"
+
+
+def extend_class(cls, mixins, after=False):
+    """
+    Returns a subclass of the formset or form class `cls` with `mixins` added in
+    front of it, or behind it if `after` is set.
+
+    The subclass is stored on `cls`, so that it is built once for each class and set
+    of mixins.
+    """
+    if not mixins:
+        return cls
+    mixins = tuple(mixins)
+    key = (mixins, after)
+    extended = cls.__dict__.get("_extended_classes")
+    if extended is None:
+        extended = cls._extended_classes = {}
+    if key not in extended:
+        bases = (cls,) + mixins if after else mixins + (cls,)
+        extended[key] = type(cls.__name__, bases, {})
+    return extended[key]
+
+
+class SharedModelChoices(object):
+    """
+    The choices of a `ModelChoiceField`, shared by the same field in every form of a
+    formset.
+
+    All the choices are loaded by a single query the first time they are rendered.
+    If they are only needed to validate submitted data, only the values submitted
+    for the field in the whole formset are loaded, also by a single query.
+    """
+
+    def __init__(self, queryset, to_field_name, values=(), objects=None):
+        self.queryset = queryset
+        self.key = to_field_name or "pk"
+        field = queryset.model._meta.get_field(
+            to_field_name or queryset.model._meta.pk.name
+        )
+        while field.remote_field is not None:
+            field = field.remote_field.get_related_field()
+        self.model_field = field
+        self.values = values
+        self._objects = objects
+        self._lookup = None
+
+    @property
+    def objects(self):
+        if self._objects is None:
+            self._objects = list(self.queryset)
+        return self._objects
+
+    def normalize(self, value):
+        """
+        Returns `value` converted to the type of the choices' key, or `None` if it
+        isn't a valid key.
+        """
+        try:
+            return self.model_field.to_python(value)
+        except ValidationError:
+            return None
+
+    def get(self, value):
+        """
+        Returns the instance matching the submitted `value`, or `None`.
+        """
+        if self._lookup is None:
+            if self._objects is None:
+                values = {self.normalize(value) for value in self.values} - {None}
+                objects = self.queryset.filter(**{self.key + "__in": values})
+            else:
+                objects = self._objects
+            self._lookup = {
+                self.normalize(obj.serializable_value(self.key)): obj for obj in objects
+            }
+        return self._lookup.get(self.normalize(value))
+
+
+class SharedModelChoiceIterator(ModelChoiceIterator):
+    """
+    Iterates over the shared choices of a field instead of querying its queryset.
+    """
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.field.shared_choices.objects:
+            yield self.choice(obj)
+
+    def __len__(self):
+        empty = 1 if self.field.empty_label is not None else 0
+        return len(self.field.shared_choices.objects) + empty
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(
+            self.field.shared_choices.objects
+        )
+
+
+class SharedModelChoiceFieldMixin(object):
+    """
+    Renders and validates a `ModelChoiceField` with its `shared_choices`.
+    """
+
+    iterator = SharedModelChoiceIterator
+    shared_choices = None
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        if isinstance(value, self.queryset.model):
+            value = value.serializable_value(self.shared_choices.key)
+        obj = self.shared_choices.get(value)
+        if obj is None:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+        return obj
+
+
+_shared_field_classes = {}
+
+
+def share_model_choices(field, shared_choices):
+    """
+    Makes the `ModelChoiceField` instance `field` use `shared_choices`.
+    """
+    field_class = field.__class__
+    if not issubclass(field_class, SharedModelChoiceFieldMixin):
+        if field_class not in _shared_field_classes:
+            _shared_field_classes[field_class] = type(
+                "Shared" + field_class.__name__,
+                (SharedModelChoiceFieldMixin, field_class),
+                {},
+            )
+        field.__class__ = _shared_field_classes[field_class]
+    field.shared_choices = shared_choices
+    field.widget.choices = field.choices
+
+
+class SharedModelChoicesFormSetMixin(object):
+    """
+    A formset mixin that loads the choices of each `ModelChoiceField` once for the
+    whole formset, instead of once for each form.
+
+    Forms whose field querysets differ, for example because they are filtered in the
+    form's `__init__`, only share the choices of identical querysets.
+    """
+
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        if "_shared_model_choices" not in self.__dict__:
+            self._shared_model_choices = {}
+        for name, field in form.fields.items():
+            if not isinstance(field, ModelChoiceField) or isinstance(
+                field, ModelMultipleChoiceField
+            ):
+                continue
+            try:
+                key = (name, str(field.queryset.query))
+            except EmptyResultSet:
+                continue
+            if key not in self._shared_model_choices:
+                self._shared_model_choices[key] = SharedModelChoices(
+                    field.queryset,
+                    field.to_field_name,
+                    self.get_submitted_values(form, name),
+                )
+            share_model_choices(field, self._shared_model_choices[key])
+
+    def get_submitted_values(self, form, name):
+        """
+        Returns the values submitted for the field `name` in every form.
+        """
+        if not self.is_bound:
+            return []
+        widget = form.fields[name].widget
+        return [
+            widget.value_from_datadict(
+                self.data, self.files, "%s-%s" % (self.add_prefix(i), name)
+            )
+            for i in range(self.total_form_count())
+        ]
+
+
+class StreamingFormSetMixin(object):
+    """
+    A formset mixin that builds its forms one at a time, so that they can be rendered
+    without keeping every form in memory.
+
+    The instances of an unbound model formset are counted rather than loaded, and
+    are then fetched in chunks while the forms are built.
+
+    While `defer_management_form` is set, the management form renders nothing, so
+    that it can be rendered after the forms with their actual number.
+    """
+
+    defer_management_form = False
+
+    @property
+    def management_form(self):
+        if self.defer_management_form:
+            return mark_safe("")
+        # Not cached, since the number of forms is only known after iter_forms().
+        return BaseFormSet.management_form.func(self)
+
+    def initial_form_count(self):
+        if (
+            isinstance(self, BaseModelFormSet)
+            and not self.is_bound
+            and self.get_queryset()._result_cache is None
+        ):
+            if "_initial_form_count" not in self.__dict__:
+                self._initial_form_count = self.get_queryset().count()
+            return self._initial_form_count
+        return super().initial_form_count()
+
+    def iter_forms(self, chunk_size=100):
+        """
+        Yields the forms of the formset without storing them in `forms`.
+        """
+        if self.is_bound or not isinstance(self, BaseModelFormSet):
+            for i in range(self.total_form_count()):
+                yield self._construct_form(i, **self.get_form_kwargs(i))
+            return
+        instances = self.get_queryset().iterator(chunk_size=chunk_size)
+        i = 0
+        for instance in itertools.islice(instances, self.initial_form_count()):
+            kwargs = self.get_form_kwargs(i)
+            kwargs["instance"] = instance
+            # BaseModelFormSet would look the instance up in the queryset.
+            yield BaseFormSet._construct_form(self, i, **kwargs)
+            i += 1
+        # Instances deleted since they were counted leave fewer initial forms, and
+        # the extra forms follow the initial forms actually built.
+        self._initial_form_count = i
+        for i in range(i, self.total_form_count()):
+            yield self._construct_form(i, **self.get_form_kwargs(i))
+
+
+class WindowFormSetMixin(object):
+    """
+    A model formset mixin that edits a window of its instances, such as a page of
+    them, given as the `window` queryset.
+
+    The primary keys submitted with the forms are looked up in the window instead
+    of being queried form by form, and those of other instances are invalid.
+    """
+
+    def __init__(self, *args, window=None, **kwargs):
+        self.window = window
+        super().__init__(*args, **kwargs)
+
+    def get_queryset(self):
+        return self.window
+
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        pk_field = form.fields.get(self._pk_field.name)
+        if (
+            not self.is_bound
+            or not isinstance(pk_field, ModelChoiceField)
+            or pk_field.to_field_name is not None
+        ):
+            return
+        if "_window_choices" not in self.__dict__:
+            self._window_choices = SharedModelChoices(
+                pk_field.queryset, None, objects=list(self.get_queryset())
+            )
+        share_model_choices(pk_field, self._window_choices)
+
+
+def run_on_worker(func):
+    """
+    Returns a function that calls `func` on a worker thread of an executor with the
+    timezone and language active in the current thread.
+
+    The database connections that `func` opens in a worker thread are closed like at
+    the end of a request, according to `CONN_MAX_AGE`.
+    """
+    thread_id = threading.get_ident()
+    current_timezone = timezone.get_current_timezone()
+    language = translation.get_language()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if threading.get_ident() == thread_id:
+            return func(*args, **kwargs)
+        try:
+            with timezone.override(current_timezone), translation.override(language):
+                return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return wrapper
+
+
+class ParallelCleanFormSetMixin(object):
+    """
+    A formset mixin that cleans its forms concurrently on `clean_executor`, a
+    `concurrent.futures.Executor`, before the formset's own cleaning.
+
+    The errors of the forms are then collected in order and the formset's `clean()`
+    is called as usual, so the result doesn't depend on the order in which the forms
+    were cleaned.
+    """
+
+    def __init__(self, *args, clean_executor=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.clean_executor = clean_executor
+
+    def full_clean(self):
+        if self.is_bound and self.clean_executor is not None:
+            forms = self.forms
+            # Consume the results to raise the exceptions of the workers.
+            for result in self.clean_executor.map(
+                run_on_worker(self.clean_form), forms
+            ):
+                pass
+        super().full_clean()
+
+    def clean_form(self, form):
+        """
+        Cleans `form` on a worker of the executor.
+        """
+        form.full_clean()
+
+
+class ColumnCleanedFormMixin(object):
+    """
+    A form mixin that takes the cleaned values of some of its fields from
+    `column_cleaned_data`, set by its formset, instead of cleaning them.
+    """
+
+    column_cleaned_data = None
+
+    def _clean_fields(self):
+        column_cleaned_data = self.column_cleaned_data
+        if not column_cleaned_data:
+            return super()._clean_fields()
+        # Keep the order of the fields for the clean_<name>() methods.
+        for name in self.fields:
+            if name in column_cleaned_data:
+                self.clean_column_field(name, column_cleaned_data[name])
+            else:
+                self.clean_field(name)
+
+    def clean_field(self, name):
+        """
+        Cleans the field `name` like Django's forms do, and calls the
+        `clean_<name>()` method.
+        """
+        bound_field = self[name]
+        field = bound_field.field
+        value = bound_field.initial if field.disabled else bound_field.data
+        try:
+            if isinstance(field, FileField):
+                value = field.clean(value, bound_field.initial)
+            else:
+                value = field.clean(value)
+            self.cleaned_data[name] = value
+            if hasattr(self, "clean_%s" % name):
+                self.cleaned_data[name] = getattr(self, "clean_%s" % name)()
+        except ValidationError as e:
+            self.add_error(name, e)
+
+    def clean_column_field(self, name, value):
+        """
+        Sets the value cleaned by the formset for the field `name`, which is a
+        `ValidationError` if it is invalid, and calls the `clean_<name>()` method.
+        """
+        try:
+            if isinstance(value, ValidationError):
+                raise value
+            self.cleaned_data[name] = value
+            if hasattr(self, "clean_%s" % name):
+                self.cleaned_data[name] = getattr(self, "clean_%s" % name)()
+        except ValidationError as e:
+            self.add_error(name, e)
+
+
+class ColumnCleanFormSetMixin(object):
+    """
+    A formset mixin that cleans the numeric fields of its forms column by column:
+    each field is cleaned for all the forms in one pass, before the forms are
+    cleaned.
+
+    Each distinct submitted value of a column is only converted and validated once,
+    which saves most of the work for columns with repeated values, such as prices
+    and quantities. The fields of the forms must validate a value the same way
+    whatever the form, which is checked by comparing their class, `required`,
+    `localize`, `validators` and `error_messages`.
+    """
+
+    column_field_classes = (IntegerField, FloatField, DecimalField)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.form = extend_class(self.form, [ColumnCleanedFormMixin])
+
+    def full_clean(self):
+        if self.is_bound:
+            self.clean_columns()
+        super().full_clean()
+
+    def clean_columns(self):
+        """
+        Sets the `column_cleaned_data` of the forms that will be cleaned.
+        """
+        forms = [
+            form
+            for form in self.forms
+            if not (form.empty_permitted and not form.has_changed())
+        ]
+        for form in forms:
+            form.column_cleaned_data = {}
+        if forms:
+            for name in self.get_column_names(forms[0]):
+                self.clean_column(name, forms)
+
+    def is_column_field(self, field):
+        return isinstance(field, self.column_field_classes) and not field.disabled
+
+    def get_column_names(self, form):
+        """
+        Returns the names of the fields of `form` cleaned column by column.
+        """
+        return [
+            name for name, field in form.fields.items() if self.is_column_field(field)
+        ]
+
+    def clean_column(self, name, forms):
+        """
+        Cleans the field `name` of all `forms`, once for each distinct value.
+        """
+        signature = None
+        results = {}
+        for form in forms:
+            field = form.fields.get(name)
+            if field is None or not self.is_column_field(field):
+                continue
+            field_signature = [
+                field.__class__,
+                field.required,
+                field.localize,
+                field.validators,
+                field.error_messages,
+            ]
+            if field_signature != signature:
+                signature = field_signature
+                results = {}
+            value = field.widget.value_from_datadict(
+                form.data, form.files, form.add_prefix(name)
+            )
+            try:
+                result = results[value]
+            except KeyError:
+                result = results[value] = self.clean_column_value(field, value)
+            except TypeError:
+                # Unhashable value, from a widget with several inputs.
+                result = self.clean_column_value(field, value)
+            form.column_cleaned_data[name] = result
+
+    def clean_column_value(self, field, value):
+        """
+        Returns `value` cleaned by `field`, or the `ValidationError` it raised.
+        """
+        try:
+            return field.clean(value)
+        except ValidationError as e:
+            return e
+
+
+class CopyOnWriteFields(MutableMapping):
+    """
+    The fields of a form, which share the field instances of its formset until they
+    are taken from the mapping, where they could be changed.
+
+    A field is copied the first time it is got from the mapping, including through
+    `get()`, `items()`, `values()` and `pop()`. The form reads the fields it renders
+    and cleans with `peek()`, which doesn't copy them.
+    """
+
+    def __init__(self, fields, share_values=False):
+        self._fields = dict(fields)
+        self._copied = set()
+        self.form = None
+        self.share_values = share_values
+
+    def __getitem__(self, name):
+        field = self._fields[name]
+        if name not in self._copied:
+            field = self._fields[name] = copy.deepcopy(field)
+            self._copied.add(name)
+            if self.form is not None:
+                # Drop the bound field of the shared instance.
+                self.form._bound_fields_cache.pop(name, None)
+        return field
+
+    def __setitem__(self, name, field):
+        self._fields[name] = field
+        self._copied.add(name)
+
+    def __delitem__(self, name):
+        del self._fields[name]
+        self._copied.discard(name)
+
+    def __contains__(self, name):
+        return name in self._fields
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __deepcopy__(self, memo):
+        # Called by BaseForm.__init__() on the shared fields.
+        return self.__class__(self._fields, self.share_values)
+
+    def values(self):
+        if not self.share_values:
+            return super().values()
+        # BaseModelForm.__init__() only changes the fields limiting their choices.
+        return [
+            self[name] if getattr(field, "limit_choices_to", None) else field
+            for name, field in self._fields.items()
+        ]
+
+    def peek(self, name):
+        """
+        Returns the field `name` without copying it. It must not be changed.
+        """
+        return self._fields[name]
+
+
+class CopyOnWriteFieldsFormMixin(object):
+    """
+    A form mixin that shares the fields given by its formset in `shared_fields`
+    instead of copying its `base_fields`, in a `CopyOnWriteFields` mapping.
+
+    It goes behind the form class, so that it wraps the `__init__()` of Django's
+    base form class only.
+    """
+
+    def __init__(self, *args, shared_fields=None, **kwargs):
+        if shared_fields is None:
+            super().__init__(*args, **kwargs)
+            return
+        self.base_fields = shared_fields
+        shared_fields.share_values = True
+        try:
+            super().__init__(*args, **kwargs)
+        finally:
+            shared_fields.share_values = False
+            del self.base_fields
+        if isinstance(self.fields, CopyOnWriteFields):
+            self.fields.share_values = False
+            self.fields.form = self
+
+    def __getitem__(self, name):
+        try:
+            return self._bound_fields_cache[name]
+        except KeyError:
+            pass
+        fields = self.fields
+        if isinstance(fields, CopyOnWriteFields) and name in fields:
+            bound_field = fields.peek(name).get_bound_field(self, name)
+            self._bound_fields_cache[name] = bound_field
+            return bound_field
+        return super().__getitem__(name)
+
+
+class CopyOnWriteFieldsForm(CopyOnWriteFieldsFormMixin, BaseForm):
+    pass
+
+
+class CopyOnWriteFieldsModelForm(CopyOnWriteFieldsFormMixin, BaseModelForm):
+    pass
+
+
+class CopyOnWriteFieldsFormSetMixin(object):
+    """
+    A formset mixin that builds its forms without copying the fields of the form
+    class for each form.
+
+    The fields are copied once for the formset, and its forms share these instances
+    until a field is taken from `form.fields`. So forms can still change their
+    fields, but must do so through `form.fields`, and not through their bound
+    fields.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if issubclass(self.form, BaseModelForm):
+            mixin = CopyOnWriteFieldsModelForm
+        else:
+            mixin = CopyOnWriteFieldsForm
+        self.form = extend_class(self.form, [mixin], after=True)
+        self.shared_fields = CopyOnWriteFields(copy.deepcopy(self.form.base_fields))
+
+    def get_form_kwargs(self, index):
+        kwargs = super().get_form_kwargs(index)
+        kwargs["shared_fields"] = self.shared_fields
+        return kwargs
+
+
+class DeferredUniqueFormMixin(object):
+    """
+    A model form mixin that leaves the validation of uniqueness against the database
+    to its formset.
+    """
+
+    def validate_unique(self):
+        pass
+
+
+class BatchedUniqueFormSetMixin(object):
+    """
+    A model formset mixin that validates the uniqueness of the instances of all its
+    forms against the database with one query for each unique field and each
+    `unique_together`, instead of one query for each form.
+
+    Uniqueness for dates (`unique_for_date`) is still validated form by form.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.form = extend_class(self.form, [DeferredUniqueFormMixin])
+
+    def validate_unique(self):
+        self.validate_unique_in_database()
+        super().validate_unique()
+
+    def validate_unique_in_database(self):
+        """
+        Adds an error to each valid form whose instance isn't unique in the
+        database.
+        """
+        forms_to_delete = self.deleted_forms
+        all_unique_checks = {}
+        for form in self.forms:
+            if not form.is_valid() or form in forms_to_delete:
+                continue
+            exclude = form._get_validation_exclusions()
+            unique_checks, date_checks = form.instance._get_unique_checks(
+                exclude=exclude
+            )
+            for unique_check in unique_checks:
+                all_unique_checks.setdefault(unique_check, []).append(form)
+            self.add_unique_errors(
+                form, form.instance._perform_date_checks(date_checks)
+            )
+        for (model_class, unique_check), forms in all_unique_checks.items():
+            self.validate_unique_check(model_class, unique_check, forms)
+
+    def validate_unique_check(self, model_class, unique_check, forms):
+        """
+        Validates the fields in `unique_check` for all `forms` with a single query.
+        """
+        fields = [model_class._meta.get_field(name) for name in unique_check]
+        candidates = []
+        for form in forms:
+            instance = form.instance
+            values = tuple(getattr(instance, field.attname) for field in fields)
+            if any(value is None for value in values):
+                continue
+            if (
+                any(field.primary_key for field in fields)
+                and not instance._state.adding
+            ):
+                continue
+            pk = (
+                None
+                if instance._state.adding
+                else instance._get_pk_val(model_class._meta)
+            )
+            candidates.append((form, values, pk))
+        if not candidates:
+            return
+        lookups = {
+            field.attname + "__in": {values[i] for form, values, pk in candidates}
+            for i, field in enumerate(fields)
+        }
+        existing = {}
+        rows = model_class._default_manager.filter(**lookups).values_list(
+            "pk", *[field.attname for field in fields]
+        )
+        for row in rows:
+            existing.setdefault(tuple(row[1:]), set()).add(row[0])
+        key = unique_check[0] if len(unique_check) == 1 else NON_FIELD_ERRORS
+        for form, values, pk in candidates:
+            if existing.get(values, set()) - {pk}:
+                error = form.instance.unique_error_message(model_class, unique_check)
+                self.add_unique_errors(form, {key: [error]})
+
+    def add_unique_errors(self, form, errors):
+        for field, field_errors in errors.items():
+            form.add_error(None if field == NON_FIELD_ERRORS else field, field_errors)
+
+
+class UnchangedFormMixin(object):
+    """
+    A form mixin that reports the form as unchanged, without comparing its data,
+    when its formset has found that its fingerprint matches.
+    """
+
+    unchanged = False
+
+    def has_changed(self):
+        return not self.unchanged and super().has_changed()
+
+
+class SkipUnchangedFormsFormSetMixin(object):
+    """
+    A model formset mixin that skips the validation and saving of the initial forms
+    whose data hasn't changed since they were rendered.
+
+    Each initial form is rendered with a hidden field holding a signed fingerprint
+    of its values. When the formset is bound, a form whose submitted values have the
+    same fingerprint is empty permitted and reported as unchanged, so its cleaning,
+    model validation and saving are skipped, and its `cleaned_data` is empty.
+    """
+
+    fingerprint_salt = "extra_views.formset_mixins.SkipUnchangedFormsFormSetMixin"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.form = extend_class(self.form, [UnchangedFormMixin])
+
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        if index is None or index >= self.initial_form_count():
+            return
+        form.fields[FINGERPRINT_FIELD_NAME] = CharField(
+            required=False, widget=HiddenInput
+        )
+        if not form.is_bound:
+            form.fields[FINGERPRINT_FIELD_NAME].initial = self.get_fingerprint(form)
+
+    def _construct_form(self, i, **kwargs):
+        form = super()._construct_form(i, **kwargs)
+        if form.is_bound and FINGERPRINT_FIELD_NAME in form.fields:
+            fingerprint = form[FINGERPRINT_FIELD_NAME].data or ""
+            if constant_time_compare(fingerprint, self.get_fingerprint(form)):
+                form.empty_permitted = True
+                form.unchanged = True
+        return form
+
+    def get_fingerprint(self, form):
+        """
+        Returns the signed fingerprint of the values of `form`, as they are rendered
+        for an unbound form or as they were submitted for a bound form.
+        """
+        values = [
+            (
+                bound_field.html_name,
+                self.get_fingerprint_value(bound_field.field, bound_field.value()),
+            )
+            for bound_field in form
+            if bound_field.name != FINGERPRINT_FIELD_NAME
+        ]
+        return salted_hmac(self.fingerprint_salt, json.dumps(values)).hexdigest()
+
+    def get_fingerprint_value(self, field, value):
+        """
+        Returns the value of `field` converted to a string that is the same for the
+        initial value and the submitted value when it hasn't changed.
+        """
+        if isinstance(field, ModelChoiceField):
+            # to_python() would query the database.
+            return str(value)
+        try:
+            return str(field.to_python(value))
+        except ValidationError:
+            return "invalid:" + str(value)
+
+
+class OptimisticConcurrencyFormSetMixin(object):
+    """
+    A model formset mixin that detects the initial forms whose instances were changed
+    by someone else since the forms were rendered, without locking them.
+
+    Each initial form is rendered with a hidden field holding the value of the
+    `version_field` of its instance, an integer field or a `DateTimeField` such as
+    an `auto_now` modification date. `claim_versions()` bumps the versions of the
+    changed and deleted instances with one conditional UPDATE, which only matches
+    the rows that still have the submitted versions.
+    """
+
+    def __init__(self, *args, version_field=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version_field = self.model._meta.get_field(version_field)
+
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        if index is None or index >= self.initial_form_count():
+            return
+        if form.is_bound:
+            # The submitted version never makes the form changed.
+            version = form.data.get(form.add_prefix(VERSION_FIELD_NAME))
+        else:
+            version = self.version_field.value_to_string(form.instance)
+        form.fields[VERSION_FIELD_NAME] = CharField(
+            required=False, widget=HiddenInput, initial=version
+        )
+
+    def get_submitted_version(self, form):
+        """
+        Returns the version submitted with `form`, or `None` if it is missing or
+        invalid.
+        """
+        try:
+            return self.version_field.to_python(form[VERSION_FIELD_NAME].data or None)
+        except ValidationError:
+            return None
+
+    def get_claimed_forms(self):
+        """
+        Returns the initial forms whose instances are changed or deleted on save.
+        """
+        deleted_forms = self.deleted_forms
+        return [
+            form
+            for form in self.initial_forms
+            if form.instance.pk is not None
+            and (form in deleted_forms or form.has_changed())
+        ]
+
+    def claim_versions(self):
+        """
+        Bumps the versions of the instances of the changed and deleted initial forms,
+        in a single query, and sets the new versions on the instances.
+
+        Returns `False` and adds an error to each form whose instance was changed by
+        someone else, leaving the database unchanged, if there are any.
+        """
+        forms = self.get_claimed_forms()
+        if not forms:
+            return True
+        attname = self.version_field.attname
+        versions = {form: self.get_submitted_version(form) for form in forms}
+        using = router.db_for_write(self.model)
+        manager = self.model._default_manager.db_manager(using)
+        if None not in versions.values():
+            is_date = isinstance(self.version_field, DateTimeField)
+            now = timezone.now()
+            condition = functools.reduce(
+                operator.or_,
+                [Q(pk=form.instance.pk, **{attname: versions[form]}) for form in forms],
+            )
+            with transaction.atomic(using=using):
+                updated = manager.filter(condition).update(
+                    **{attname: now if is_date else F(attname) + 1}
+                )
+                if updated == len(forms):
+                    for form in forms:
+                        new_version = now if is_date else versions[form] + 1
+                        setattr(form.instance, attname, new_version)
+                    return True
+                transaction.set_rollback(True, using=using)
+        current = dict(
+            manager.filter(pk__in=[form.instance.pk for form in forms]).values_list(
+                "pk", attname
+            )
+        )
+        for form in forms:
+            if current.get(form.instance.pk) != versions[form]:
+                form.add_error(None, self.get_conflict_message(form))
+        return False
+
+    def get_conflict_message(self, form):
+        return _(
+            "This row was changed or deleted by someone else since it was loaded. "
+            "Reload the page to see the changes."
+        )
@@ -1,6 +1,50 @@
-from django.forms.formsets import formset_factory
-from django.forms.models import inlineformset_factory, modelformset_factory
-from django.http import HttpResponseRedirect
+import hashlib
+import json
+from calendar import timegm
+from contextlib import ExitStack
+from uuid import uuid4
+
+import django
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    RequestDataTooBig,
+    SuspiciousOperation,
+    TooManyFieldsSent,
+    ValidationError,
+)
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections, router, transaction
+from django.db.models import Max, Prefetch, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.forms import FileField
+from django.forms.formsets import TOTAL_FORM_COUNT, formset_factory
+from django.forms.models import (
+    BaseInlineFormSet,
+    BaseModelFormSet,
+    _get_foreign_key,
+    inlineformset_factory,
+    modelformset_factory,
+)
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+    QueryDict,
+    StreamingHttpResponse,
+)
+from django.template.loader import select_template
+from django.utils.cache import get_conditional_response
+from django.utils.functional import SimpleLazyObject
+from django.utils.http import http_date, quote_etag
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+from django.utils.translation import gettext as _
 from django.views.generic.base import ContextMixin, TemplateResponseMixin, View
 from django.views.generic.detail import (
     SingleObjectMixin,
@@ -11,6 +55,252 @@ from django.views.generic.list import (
     MultipleObjectTemplateResponseMixin,
 )
 
+from extra_views.formset_mixins import (
+    BatchedUniqueFormSetMixin,
+    ColumnCleanFormSetMixin,
+    CopyOnWriteFieldsFormSetMixin,
+    OptimisticConcurrencyFormSetMixin,
+    ParallelCleanFormSetMixin,
+    SharedModelChoicesFormSetMixin,
+    SkipUnchangedFormsFormSetMixin,
+    StreamingFormSetMixin,
+    WindowFormSetMixin,
+    extend_class,
+)
+
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:  # Django < 3.0, which doesn't support async views.
+    sync_to_async = None
+
+#: The maximum number of formset classes kept by `BaseFormSetFactory` when
+#: `cache_formset_class` is enabled. The oldest entry is dropped once it is reached.
+FORMSET_CLASS_CACHE_SIZE = 256
+
+_formset_class_cache = {}
+
+
+def clear_formset_class_cache():
+    """
+    Empties the cache of formset classes shared by views with `cache_formset_class`.
+    """
+    _formset_class_cache.clear()
+
+
+def _formset_cache_version_key(model):
+    return "extra_views.formset_cache_version.%s" % model._meta.label_lower
+
+
+def check_shared_cache(using=DEFAULT_CACHE_ALIAS):
+    """
+    Raises `ImproperlyConfigured` if the cache `using` is local to each process, so
+    that the versions of the cached formsets would only change in the process that
+    saved the models, or if it is a dummy cache, which keeps no versions at all.
+    """
+    cache = caches[using]
+    for backend in (LocMemCache, DummyCache):
+        if isinstance(cache, backend):
+            raise ImproperlyConfigured(
+                "The versions of the cached formsets must be kept in a cache shared "
+                "by all the processes, but the cache %r is a %s."
+                % (using, backend.__name__)
+            )
+
+
+def get_formset_cache_versions(models, using=DEFAULT_CACHE_ALIAS):
+    """
+    Returns the versions of the formsets of `models` cached in the cache `using`,
+    which must be shared by all the processes.
+    """
+    check_shared_cache(using)
+    cache = caches[using]
+    keys = [_formset_cache_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid4().hex, None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def invalidate_formset_cache(model, using=DEFAULT_CACHE_ALIAS):
+    """
+    Invalidates the formsets cached in the cache `using` that depend on `model`.
+
+    This is called when an instance of a model of a cached formset is saved or
+    deleted. Call it after changing the model in a way that sends no signals, such
+    as `QuerySet.update()`.
+    """
+    caches[using].set(_formset_cache_version_key(model), uuid4().hex, None)
+
+
+_formset_cache_aliases = {}
+
+
+def watch_formset_cache_model(model, using=DEFAULT_CACHE_ALIAS):
+    """
+    Invalidates the formsets cached in the cache `using` that depend on `model`
+    whenever an instance of `model` is saved or deleted.
+    """
+    aliases = _formset_cache_aliases.setdefault(model, set())
+    if using in aliases:
+        return
+    aliases.add(using)
+
+    def receiver(sender, **kwargs):
+        invalidate_formset_cache(sender, using)
+
+    dispatch_uid = "extra_views.formset_cache.%s.%s" % (model._meta.label_lower, using)
+    for signal in (post_save, post_delete):
+        signal.connect(receiver, sender=model, weak=False, dispatch_uid=dispatch_uid)
+
+
+def get_request_cache_scope(request):
+    """
+    Returns the parts of a cache key that depend on `request`: its path with the
+    query string, its language and its user.
+    """
+    user = getattr(request, "user", None)
+    return [
+        request.get_full_path(),
+        get_language(),
+        user.pk if user is not None and user.is_authenticated else None,
+    ]
+
+
+def _freeze(value):
+    """
+    Converts the lists and dicts found in factory kwargs into hashable tuples.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+def _bulk_update_fields(model, changed_objects):
+    """
+    Returns the names of the concrete model fields changed in `changed_objects`,
+    along with the fields updated automatically on save.
+    """
+    opts = model._meta
+    field_names = set()
+    for obj, changed_data in changed_objects:
+        for name in changed_data:
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if field.concrete and not field.many_to_many and not field.primary_key:
+                field_names.add(field.name)
+    if field_names:
+        for field in opts.concrete_fields:
+            if getattr(field, "auto_now", False):
+                for obj, changed_data in changed_objects:
+                    field.pre_save(obj, False)
+                field_names.add(field.name)
+    return sorted(field_names)
+
+
+def _can_return_rows_from_bulk_insert(using):
+    """
+    Returns whether `bulk_create` sets the primary keys of the new instances on the
+    database `using`.
+    """
+    features = connections[using].features
+    # Named can_return_ids_from_bulk_insert before Django 3.0.
+    return getattr(
+        features,
+        "can_return_rows_from_bulk_insert",
+        getattr(features, "can_return_ids_from_bulk_insert", False),
+    )
+
+
+def _bulk_save_model(model, formsets):
+    """
+    Writes the instances of `model` deleted, created and changed by `formsets`, which
+    were saved with `commit=False`, with one query per operation.
+    """
+    using = router.db_for_write(model)
+    manager = model._default_manager.db_manager(using)
+    deleted_objects = [obj for formset in formsets for obj in formset.deleted_objects]
+    if deleted_objects:
+        manager.filter(pk__in=[obj.pk for obj in deleted_objects]).delete()
+    new_objects = [obj for formset in formsets for obj in formset.new_objects]
+    if new_objects:
+        if _can_return_rows_from_bulk_insert(using):
+            manager.bulk_create(new_objects)
+        else:
+            # The primary keys of the new instances are needed by save_m2m().
+            for obj in new_objects:
+                obj.save(using=using)
+    changed_objects = [
+        changed for formset in formsets for changed in formset.changed_objects
+    ]
+    fields = _bulk_update_fields(model, changed_objects)
+    if fields:
+        manager.bulk_update([obj for obj, changed_data in changed_objects], fields)
+
+
+def bulk_save_formset(formset):
+    """
+    Saves a valid model formset with one query per operation, in a transaction:
+    `bulk_create` for the new instances, `bulk_update` of the changed fields for the
+    changed instances and a single delete for the deleted instances.
+
+    The `save()` methods of the forms and models are not called, and no
+    `pre_save` or `post_save` signals are sent.
+    """
+    return bulk_save_formsets([formset])[0]
+
+
+def bulk_save_formsets(formsets):
+    """
+    Saves valid model formsets like `bulk_save_formset()`, in a single transaction,
+    with one query per operation for all the formsets of the same model.
+
+    Returns the list of the saved instances of each formset.
+    """
+    formsets_by_model = {}
+    for formset in formsets:
+        formsets_by_model.setdefault(formset.model, []).append(formset)
+    usings = {router.db_for_write(model) for model in formsets_by_model}
+    with ExitStack() as stack:
+        for using in sorted(usings):
+            stack.enter_context(transaction.atomic(using=using))
+        for formset in formsets:
+            formset.save(commit=False)
+        for model, model_formsets in formsets_by_model.items():
+            _bulk_save_model(model, model_formsets)
+        for formset in formsets:
+            formset.save_m2m()
+    for model in formsets_by_model:
+        for using in _formset_cache_aliases.get(model, ()):
+            # Only the deleted instances sent signals.
+            invalidate_formset_cache(model, using)
+    return [
+        [obj for obj, changed_data in formset.changed_objects] + formset.new_objects
+        for formset in formsets
+    ]
+
+
+def save_formset(formset, bulk=False):
+    """
+    Saves a valid model formset, with `bulk_save_formset()` if `bulk` is set, and
+    returns the saved instances.
+
+    If the formset has a `version_field`, the versions of its instances are claimed
+    in the same transaction. When some instances were changed by someone else,
+    nothing is saved, errors are added to their forms and `None` is returned.
+    """
+    if not hasattr(formset, "claim_versions"):
+        return bulk_save_formset(formset) if bulk else formset.save()
+    with transaction.atomic(using=router.db_for_write(formset.model)):
+        if not formset.claim_versions():
+            return None
+        return bulk_save_formset(formset) if bulk else formset.save()
+
 
 class BaseFormSetFactory(object):
     """
@@ -26,13 +316,261 @@ class BaseFormSetFactory(object):
     formset_kwargs = {}
     factory_kwargs = {}
     form_kwargs = {}
+    cache_formset_class = False
+    share_model_choices = False
+    copy_post_data = False
+    accept_sparse_data = False
+    accept_json = False
+    json_form_indexes = None
+    clean_executor = None
+    clean_by_column = False
+    copy_fields_on_write = False
+    max_content_length = None
 
     def construct_formset(self):
         """
         Returns an instance of the formset
         """
-        formset_class = self.get_formset()
-        return formset_class(**self.get_formset_kwargs())
+        formset_class = extend_class(self.get_formset(), self.get_formset_mixins())
+        if self.is_submitted():
+            self.check_submission_size(formset_class)
+        kwargs = self.get_formset_kwargs()
+        if kwargs.get("data") is not None:
+            if self.is_json_request():
+                kwargs["data"] = self.get_json_formset_data(formset_class, kwargs)
+            elif self.accept_sparse_data:
+                kwargs["data"] = self.expand_sparse_data(formset_class, kwargs)
+        return formset_class(**kwargs)
+
+    def is_submitted(self):
+        """
+        Returns whether the formset is bound to the data of the request, which is
+        the case for POST and PUT requests.
+        """
+        return self.request.method in ("POST", "PUT")
+
+    def check_submission_size(self, formset_class):
+        """
+        Rejects a submitted formset before its forms are built if the request body
+        is longer than `max_content_length`, or if the management form has more
+        forms than the `absolute_max` of the formset.
+
+        The length is taken from the `Content-Length` header, but middleware such as
+        `CsrfViewMiddleware` may already have read the body.
+        """
+        max_content_length = self.max_content_length
+        if max_content_length is not None:
+            try:
+                content_length = int(self.request.META.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                content_length = 0
+            if content_length > max_content_length:
+                raise RequestDataTooBig(
+                    "The submitted formset is longer than %d bytes."
+                    % max_content_length
+                )
+        if self.is_json_request():
+            # The rows are counted when they are read.
+            return
+        prefix = self.get_prefix() or formset_class.get_default_prefix()
+        try:
+            total_form_count = int(self.request.POST.get(prefix + "-TOTAL_FORMS"))
+        except (TypeError, ValueError):
+            # A missing or invalid management form is reported by the formset.
+            return
+        self.check_total_form_count(formset_class, total_form_count)
+
+    def check_total_form_count(self, formset_class, total_form_count):
+        """
+        Rejects a submitted formset of `total_form_count` forms if it has more forms
+        than the `absolute_max` of the formset.
+        """
+        if total_form_count > formset_class.absolute_max:
+            raise TooManyFieldsSent(
+                "The submitted formset has %d forms, more than the maximum of %d."
+                % (total_form_count, formset_class.absolute_max)
+            )
+
+    def is_json_request(self):
+        """
+        Returns whether the formset is submitted as JSON rather than form data.
+        """
+        return self.accept_json and self.request.content_type == "application/json"
+
+    def get_json_rows(self):
+        """
+        Returns the list of row objects in the JSON body of the request.
+        """
+        try:
+            rows = json.loads(self.request.body)
+        except ValueError:
+            raise SuspiciousOperation("The formset data isn't valid JSON.")
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            raise SuspiciousOperation("The formset data must be a list of objects.")
+        return rows
+
+    def check_json_row(self, formset_class, row):
+        """
+        Rejects a row of a formset submitted as JSON that has a value of the wrong
+        type: an object, or a list for a field that doesn't take multiple values.
+        """
+        base_fields = formset_class.form.base_fields
+        for name, value in row.items():
+            values = [value]
+            if isinstance(value, list):
+                field = base_fields.get(name)
+                widget = getattr(field, "widget", None)
+                if not getattr(widget, "allow_multiple_selected", False):
+                    raise SuspiciousOperation(
+                        "The formset data has a list for the field %r, which takes a "
+                        "single value." % name
+                    )
+                values = value
+            if not all(
+                value is None or isinstance(value, (str, int, float))
+                for value in values
+            ):
+                raise SuspiciousOperation(
+                    "The formset data has an invalid value for the field %r." % name
+                )
+
+    def get_json_formset_data(self, formset_class, formset_kwargs):
+        """
+        Returns the data of a formset submitted as a JSON list of row objects, each
+        holding the values of one form by field name.
+
+        For model formsets, the rows holding a primary key are the initial forms,
+        and the other rows are new forms. `json_form_indexes` is set to the index of
+        the form of each row.
+        """
+        rows = self.get_json_rows()
+        self.check_total_form_count(formset_class, len(rows))
+        for row in rows:
+            self.check_json_row(formset_class, row)
+        model = getattr(formset_class, "model", None)
+        if model is None:
+            initial_form_count = min(
+                len(formset_kwargs.get("initial") or []), len(rows)
+            )
+            form_indexes = list(range(len(rows)))
+        else:
+            pk_name = model._meta.pk.name
+            is_initial = [row.get(pk_name) not in (None, "") for row in rows]
+            initial_form_count = sum(is_initial)
+            # The initial forms come first, in the order of the rows.
+            order = sorted(range(len(rows)), key=lambda i: (not is_initial[i], i))
+            form_indexes = [None] * len(rows)
+            for index, row_index in enumerate(order):
+                form_indexes[row_index] = index
+        prefix = formset_kwargs.get("prefix") or formset_class.get_default_prefix()
+        data = {
+            "%s-TOTAL_FORMS" % prefix: len(rows),
+            "%s-INITIAL_FORMS" % prefix: initial_form_count,
+        }
+        for row, index in zip(rows, form_indexes):
+            for name, value in row.items():
+                data["%s-%s-%s" % (prefix, index, name)] = value
+        self.json_form_indexes = form_indexes
+        return data
+
+    def expand_sparse_data(self, formset_class, formset_kwargs):
+        """
+        Returns the full data of a formset that was submitted with its changed forms
+        only.
+
+        The forms are keyed by index as usual, or by primary key as
+        `<prefix>-pk-<pk>-<field>` for the initial forms of a model formset. The
+        data of the initial forms that weren't submitted, and of the management
+        form if it wasn't submitted, is filled in from the unbound formset.
+        """
+        unbound_kwargs = formset_kwargs.copy()
+        del unbound_kwargs["data"]
+        unbound_kwargs.pop("files", None)
+        formset = formset_class(**unbound_kwargs)
+        data = QueryDict(mutable=True)
+        submitted = set()
+        pk_indexes = None
+        for key, values in formset_kwargs["data"].lists():
+            index, sep, field = key[len(formset.prefix) + 1 :].partition("-")
+            if not key.startswith(formset.prefix + "-") or not sep:
+                data.setlist(key, values)
+                continue
+            if index == "pk":
+                if pk_indexes is None:
+                    pk_indexes = self.get_sparse_pk_indexes(formset)
+                pk, sep, field = field.partition("-")
+                if pk not in pk_indexes:
+                    continue
+                index = pk_indexes[pk]
+                pk_name = formset.model._meta.pk.name
+                data[formset.add_prefix(index) + "-" + pk_name] = pk
+            elif not index.isdigit():
+                data.setlist(key, values)
+                continue
+            submitted.add(int(index))
+            data.setlist(formset.add_prefix(index) + "-" + field, values)
+
+        initial_form_count = formset.initial_form_count()
+        management_data = {
+            "TOTAL_FORMS": max([initial_form_count - 1] + list(submitted)) + 1,
+            "INITIAL_FORMS": initial_form_count,
+        }
+        self.check_total_form_count(formset_class, management_data["TOTAL_FORMS"])
+        for name, value in management_data.items():
+            data.setdefault(formset.add_prefix(name), str(value))
+        for index in range(initial_form_count):
+            if index not in submitted:
+                form = formset._construct_form(index, **formset.get_form_kwargs(index))
+                self.add_sparse_form_data(data, form)
+        return data
+
+    def get_sparse_pk_indexes(self, formset):
+        """
+        Returns a dict of the indexes of the initial forms of a model formset by the
+        primary key of their instance.
+        """
+        return {str(obj.pk): i for i, obj in enumerate(formset.get_queryset())}
+
+    def add_sparse_form_data(self, data, form):
+        """
+        Adds the data that would be submitted for the unchanged, unbound `form`.
+        """
+        for name, field in form.fields.items():
+            value = form[name].value()
+            if value is None or isinstance(field, FileField):
+                continue
+            if not isinstance(value, (list, tuple)):
+                value = [value]
+            data.setlist(form.add_prefix(name), [str(val) for val in value])
+
+    def get_formset_mixins(self):
+        """
+        Returns the mixins added to the formset class for the options enabled on
+        this view.
+        """
+        mixins = []
+        if self.share_model_choices:
+            mixins.append(SharedModelChoicesFormSetMixin)
+        if self.copy_fields_on_write:
+            if django.VERSION < (4, 0):
+                # Older forms read every field from form.fields, which copies them.
+                raise ImproperlyConfigured(
+                    "%s.copy_fields_on_write requires Django 4.0 or later."
+                    % self.__class__.__name__
+                )
+            mixins.append(CopyOnWriteFieldsFormSetMixin)
+        if self.clean_by_column:
+            mixins.append(ColumnCleanFormSetMixin)
+        if self.get_clean_executor() is not None:
+            mixins.append(ParallelCleanFormSetMixin)
+        return mixins
+
+    def get_clean_executor(self):
+        """
+        Returns the `concurrent.futures.Executor` on which the forms of a bound
+        formset are cleaned, or `None` to clean them one after the other.
+        """
+        return self.clean_executor
 
     def get_initial(self):
         """
@@ -68,7 +606,33 @@ class BaseFormSetFactory(object):
         """
         Returns the formset class from the formset factory
         """
-        return formset_factory(self.get_form_class(), **self.get_factory_kwargs())
+        return self.build_formset_class(
+            formset_factory, self.get_form_class(), **self.get_factory_kwargs()
+        )
+
+    def build_formset_class(self, factory, *args, **kwargs):
+        """
+        Calls `factory` to build the formset class.
+
+        If `cache_formset_class` is set, the class is shared between requests and
+        only rebuilt when the factory arguments (model, form class and factory
+        kwargs) change, or after `clear_formset_class_cache()` is called.
+        """
+        if not self.cache_formset_class:
+            return factory(*args, **kwargs)
+        try:
+            key = (factory, args, _freeze(kwargs))
+            formset_class = _formset_class_cache.get(key)
+        except TypeError:
+            # Unhashable factory arguments, the class cannot be cached.
+            return factory(*args, **kwargs)
+        if formset_class is not None:
+            return formset_class
+        formset_class = factory(*args, **kwargs)
+        if len(_formset_class_cache) >= FORMSET_CLASS_CACHE_SIZE:
+            _formset_class_cache.pop(next(iter(_formset_class_cache)), None)
+        _formset_class_cache[key] = formset_class
+        return formset_class
 
     def get_formset_kwargs(self):
         """
@@ -77,13 +641,27 @@ class BaseFormSetFactory(object):
         kwargs = self.formset_kwargs.copy()
         kwargs.update({"initial": self.get_initial(), "prefix": self.get_prefix()})
         kwargs.setdefault("form_kwargs", {}).update(self.get_form_kwargs())
+        clean_executor = self.get_clean_executor()
+        if clean_executor is not None:
+            kwargs["clean_executor"] = clean_executor
 
-        if self.request.method in ("POST", "PUT"):
+        if self.is_submitted():
             kwargs.update(
-                {"data": self.request.POST.copy(), "files": self.request.FILES}
+                {"data": self.get_formset_data(), "files": self.request.FILES}
             )
         return kwargs
 
+    def get_formset_data(self):
+        """
+        Returns the data to bind the formset to.
+
+        This is the immutable `request.POST`, or a mutable copy of it if
+        `copy_post_data` is set.
+        """
+        if self.copy_post_data:
+            return self.request.POST.copy()
+        return self.request.POST
+
     def get_factory_kwargs(self):
         """
         Returns the keyword arguments for calling the formset factory
@@ -94,12 +672,262 @@ class BaseFormSetFactory(object):
         return kwargs
 
 
+class BaseModelFormSetFactory(BaseFormSetFactory):
+    """
+    Base class for constructing a FormSet of model forms in a view, with the options
+    shared by model and inline formsets.
+    """
+
+    exclude = None
+    fields = None
+    batch_unique_checks = False
+    skip_unchanged_forms = False
+    version_field = None
+
+    def get_formset_mixins(self):
+        """
+        Returns the mixins added to the formset class for the options enabled on
+        this view.
+        """
+        mixins = super().get_formset_mixins()
+        if self.batch_unique_checks:
+            mixins.append(BatchedUniqueFormSetMixin)
+        if self.skip_unchanged_forms:
+            mixins.append(SkipUnchangedFormsFormSetMixin)
+        if self.version_field:
+            mixins.append(OptimisticConcurrencyFormSetMixin)
+        return mixins
+
+    def get_formset_kwargs(self):
+        """
+        Returns the keyword arguments for instantiating the formset.
+        """
+        kwargs = super().get_formset_kwargs()
+        if self.version_field:
+            kwargs["version_field"] = self.version_field
+        return kwargs
+
+
+class ConditionalGetMixin(object):
+    """
+    A view mixin that answers conditional GET and HEAD requests with a 304 Not
+    Modified response before doing any other work, when `conditional_get` is set.
+
+    The ETag is built from the versions kept in the cache by
+    `watch_formset_cache_model` for the models of the view, so checking it doesn't
+    query the database. The cache must be shared by all the processes. If
+    `last_modified_field` is set, the Last-Modified date is the latest value of that
+    field in `get_last_modified_querysets()`.
+    """
+
+    conditional_get = False
+    conditional_cache_alias = DEFAULT_CACHE_ALIAS
+    last_modified_field = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.conditional_get:
+            for model in cls.get_conditional_view_models():
+                watch_formset_cache_model(model, cls.conditional_cache_alias)
+
+    @classmethod
+    def get_conditional_view_models(cls):
+        """
+        Returns the models of the view that are watched as soon as it is defined.
+        """
+        models = [getattr(cls, name, None) for name in ("model", "inline_model")]
+        models += [inline.model for inline in getattr(cls, "inlines", [])]
+        return [model for model in models if model is not None]
+
+    def get_conditional_models(self):
+        """
+        Returns the models whose changes change the ETag of the view.
+        """
+        model = getattr(self, "model", None)
+        if model is None and hasattr(self, "get_queryset"):
+            model = self.get_queryset().model
+        return [model] if model is not None else []
+
+    def get_conditional_scope(self):
+        """
+        Returns the parts of the ETag that depend on the request: its path with the
+        query string, its language and its user.
+        """
+        return get_request_cache_scope(self.request)
+
+    def get_etag(self):
+        """
+        Returns the ETag of the response, or `None` if the view has no models or if
+        the version of one of them can't be read from the cache.
+        """
+        models = self.get_conditional_models()
+        if not models:
+            return None
+        for model in models:
+            watch_formset_cache_model(model, self.conditional_cache_alias)
+        versions = get_formset_cache_versions(models, self.conditional_cache_alias)
+        if None in versions:
+            return None
+        parts = [
+            "%s.%s" % (self.__class__.__module__, self.__class__.__qualname__),
+            self.get_conditional_scope(),
+            versions,
+        ]
+        return hashlib.md5(json.dumps(parts, default=str).encode()).hexdigest()
+
+    def get_last_modified_querysets(self):
+        """
+        Returns the querysets searched for the Last-Modified date of the response.
+        """
+        return [self.get_queryset()]
+
+    def get_last_modified(self):
+        """
+        Returns the Last-Modified date of the response, or `None` if
+        `last_modified_field` isn't set or there are no instances.
+        """
+        if self.last_modified_field is None:
+            return None
+        dates = [
+            queryset.aggregate(last_modified=Max(self.last_modified_field))[
+                "last_modified"
+            ]
+            for queryset in self.get_last_modified_querysets()
+        ]
+        dates = [date for date in dates if date is not None]
+        return max(dates) if dates else None
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.conditional_get:
+            return super().dispatch(request, *args, **kwargs)
+        # Async views run dispatch() in the event loop, where the checks can't query
+        # the database.
+        if getattr(self, "view_is_async", False):
+            raise ImproperlyConfigured(
+                "%s is async, but conditional_get is only supported by sync views."
+                % self.__class__.__name__
+            )
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+        etag = self.get_etag()
+        etag = quote_etag(etag) if etag is not None else None
+        last_modified = self.get_last_modified()
+        last_modified = (
+            timegm(last_modified.utctimetuple()) if last_modified is not None else None
+        )
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            return response
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code == 200:
+            if etag is not None and not response.has_header("ETag"):
+                response["ETag"] = etag
+            if last_modified is not None and not response.has_header("Last-Modified"):
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+
+
+class PartialRenderMixin(object):
+    """
+    A view mixin that builds and renders a single formset, or a single form of it,
+    when `partial_render` is set and the request names its prefix in the
+    `partial_kwarg` query parameter, and its index in `partial_form_kwarg`.
+
+    Partial requests are never saved. On POST, the fragment is bound to the data
+    and rendered with its errors.
+    """
+
+    partial_render = False
+    partial_kwarg = "partial"
+    partial_form_kwarg = "form"
+
+    def get_partial_prefix(self):
+        """
+        Returns the prefix of the formset to render alone, or `None` to handle the
+        request with the whole view.
+        """
+        if not self.partial_render:
+            return None
+        return self.request.GET.get(self.partial_kwarg) or None
+
+    def get_partial_form_index(self):
+        """
+        Returns the index of the form to render alone, or `None` to render the
+        whole formset.
+        """
+        index = self.request.GET.get(self.partial_form_kwarg)
+        if index is None:
+            return None
+        try:
+            index = int(index)
+        except ValueError:
+            index = -1
+        if index < 0:
+            raise Http404(
+                _("Invalid form index (%(index)s)")
+                % {"index": self.request.GET[self.partial_form_kwarg]}
+            )
+        return index
+
+    def construct_partial_formset(self, prefix):
+        """
+        Returns the formset with the prefix `prefix`, without building the others.
+        """
+        raise NotImplementedError(
+            "%s must implement construct_partial_formset()" % self.__class__.__name__
+        )
+
+    def get_partial_form(self, formset, index):
+        """
+        Returns the form of `formset` at `index`, built alone. Past the forms of the
+        formset, it is a new extra form, to add a row to the formset.
+        """
+        return formset._construct_form(index, **formset.get_form_kwargs(index))
+
+    def render_partial(self, fragment):
+        """
+        Returns the HTML of the formset or form rendered alone.
+        """
+        return str(fragment)
+
+    def render_partial_response(self, prefix):
+        """
+        Returns a response with the formset with the prefix `prefix`, or with its
+        form at the index given in the request, rendered alone.
+        """
+        fragment = self.construct_partial_formset(prefix)
+        index = self.get_partial_form_index()
+        if index is not None:
+            fragment = self.get_partial_form(fragment, index)
+        return HttpResponse(
+            self.render_partial(fragment),
+            content_type=getattr(self, "content_type", None),
+        )
+
+
 class FormSetMixin(BaseFormSetFactory, ContextMixin):
     """
     A view mixin that provides a way to show and handle a single formset in a request.
     """
 
     success_url = None
+    stream_formset = False
+    stream_chunk_size = 100
+    cache_formset = False
+    formset_cache_alias = DEFAULT_CACHE_ALIAS
+    formset_cache_timeout = DEFAULT_TIMEOUT
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_formset:
+            # Watch the models as soon as the view is defined, so that their changes
+            # invalidate the cache even in processes which don't render the view.
+            for name in ("model", "inline_model"):
+                model = getattr(cls, name, None)
+                if model is not None:
+                    watch_formset_cache_model(model, cls.formset_cache_alias)
 
     def get_success_url(self):
         """
@@ -112,10 +940,22 @@ class FormSetMixin(BaseFormSetFactory, ContextMixin):
             url = self.request.get_full_path()
         return url
 
+    def get_formset_mixins(self):
+        """
+        Returns the mixins added to the formset class for the options enabled on
+        this view.
+        """
+        mixins = super().get_formset_mixins()
+        if self.stream_formset:
+            mixins.append(StreamingFormSetMixin)
+        return mixins
+
     def formset_valid(self, formset):
         """
         If the formset is valid redirect to the supplied URL
         """
+        if self.is_json_request():
+            return JsonResponse({"success_url": self.get_success_url()})
         return HttpResponseRedirect(self.get_success_url())
 
     def formset_invalid(self, formset):
@@ -123,10 +963,217 @@ class FormSetMixin(BaseFormSetFactory, ContextMixin):
         If the formset is invalid, re-render the context data with the
         data-filled formset and errors.
         """
+        if self.is_json_request():
+            return JsonResponse(self.get_json_errors(formset), status=400)
         return self.render_to_response(self.get_context_data(formset=formset))
 
+    def get_json_errors(self, formset):
+        """
+        Returns the errors of a formset submitted as JSON, with the errors of each
+        form in the order of the submitted rows.
+        """
+        return {
+            "errors": [
+                formset.forms[index].errors.get_json_data()
+                for index in self.json_form_indexes
+            ],
+            "non_form_errors": formset.non_form_errors().get_json_data(),
+        }
+
+    def get_formset_cache_models(self):
+        """
+        Returns the models whose changes invalidate the cached formset.
+        """
+        return []
+
+    def get_conditional_models(self):
+        """
+        Returns the models whose changes change the ETag of the view.
+        """
+        return self.get_formset_cache_models()
+
+    def construct_partial_formset(self, prefix):
+        """
+        Returns the formset of the view if its prefix is `prefix`.
+        """
+        formset = self.construct_formset()
+        if formset.prefix != prefix:
+            raise Http404(
+                _("No formset with the prefix %(prefix)s") % {"prefix": prefix}
+            )
+        return formset
+
+    def get_formset_cache_scope(self):
+        """
+        Returns the parts of the cache key of the formset that depend on the request:
+        its path with the query string, its language and its user.
+        """
+        return get_request_cache_scope(self.request)
+
+    def get_formset_cache_key(self):
+        """
+        Returns the cache key of the rendered unbound formset.
+        """
+        models = self.get_formset_cache_models()
+        for model in models:
+            watch_formset_cache_model(model, self.formset_cache_alias)
+        parts = [
+            "%s.%s" % (self.__class__.__module__, self.__class__.__qualname__),
+            self.get_prefix(),
+            self.get_formset_cache_scope(),
+            get_formset_cache_versions(models, self.formset_cache_alias),
+        ]
+        digest = hashlib.md5(json.dumps(parts, default=str).encode()).hexdigest()
+        return "extra_views.formset_cache.%s" % digest
+
+    def get_cached_formset_context_data(self):
+        """
+        Returns the context with the rendered unbound formset in `rendered_formset`,
+        taken from the cache when it is there.
+
+        The formset given as `formset` is only built when it is used, so templates
+        that only render `rendered_formset` don't build it on a cache hit.
+        """
+        formset = SimpleLazyObject(self.construct_formset)
+        cache = caches[self.formset_cache_alias]
+        key = self.get_formset_cache_key()
+        rendered_formset = cache.get(key)
+        if rendered_formset is None:
+            rendered_formset = self.render_formset(formset)
+            cache.set(key, rendered_formset, self.formset_cache_timeout)
+        return self.get_context_data(
+            formset=formset, rendered_formset=mark_safe(rendered_formset)
+        )
+
+    def render_formset(self, formset):
+        """
+        Returns the HTML of the formset cached by `cache_formset`.
+        """
+        return str(formset)
+
+    def render_to_streaming_response(self, formset):
+        """
+        Returns a response that streams the template with the forms of the unbound
+        `formset`, built and rendered `stream_chunk_size` forms at a time.
 
-class ModelFormSetMixin(FormSetMixin, MultipleObjectMixin):
+        The forms are rendered in place of the `streamed_forms` context variable,
+        followed by the management form with the number of forms actually built.
+        `{{ formset.management_form }}` renders nothing in the template.
+        """
+        formset.defer_management_form = True
+        marker = "<!--%s-->" % uuid4().hex
+        context = self.get_context_data(
+            formset=formset, streamed_forms=mark_safe(marker)
+        )
+        template = select_template(self.get_template_names())
+        content = template.render(context, self.request)
+        if marker not in content:
+            raise ImproperlyConfigured(
+                "The template of %s must render {{ streamed_forms }} when "
+                "stream_formset is set." % self.__class__.__name__
+            )
+        head, tail = content.split(marker, 1)
+        return StreamingHttpResponse(
+            self.stream_formset_content(formset, head, tail),
+            content_type=self.content_type,
+        )
+
+    def stream_formset_content(self, formset, head, tail):
+        """
+        Yields the content of the streamed response in chunks.
+        """
+        yield head
+        chunk = []
+        for form in formset.iter_forms(self.stream_chunk_size):
+            chunk.append(self.render_streamed_form(form))
+            if len(chunk) == self.stream_chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        if chunk:
+            yield "".join(chunk)
+        formset.defer_management_form = False
+        yield str(formset.management_form) + tail
+
+    def render_streamed_form(self, form):
+        """
+        Returns the HTML of one of the streamed forms.
+        """
+        return str(form)
+
+
+class FormSetPaginationMixin(object):
+    """
+    A view mixin that paginates the instances of a model formset when
+    `paginate_formset` is set, by page number or by a unique `keyset_field`.
+    """
+
+    paginate_formset = False
+    keyset_field = None
+    cursor_kwarg = "after"
+    formset_pagination = None
+
+    def get_keyset_field(self):
+        """
+        Returns the unique field used to paginate the formset by keyset, or `None` to
+        paginate by page number.
+        """
+        return self.keyset_field
+
+    def paginate_formset_queryset(self, queryset, page_size):
+        """
+        Returns the current page of `queryset`, and stores its pagination context
+        in `formset_pagination`.
+        """
+        if self.get_keyset_field():
+            self.formset_pagination = self.paginate_keyset(queryset, page_size)
+        else:
+            self.formset_pagination = self.paginate_formset_pages(queryset, page_size)
+        return self.formset_pagination["object_list"]
+
+    def paginate_formset_pages(self, queryset, page_size):
+        """
+        Returns the pagination context for the current page of `queryset`.
+        """
+        raise NotImplementedError(
+            "%s must implement paginate_formset_pages()" % self.__class__.__name__
+        )
+
+    def paginate_keyset(self, queryset, page_size):
+        """
+        Returns the pagination context for the page of `queryset` that follows the
+        cursor given in `cursor_kwarg`.
+
+        The keyset field must be unique, it may be prefixed with "-" for a
+        descending order.
+        """
+        keyset_field = self.get_keyset_field()
+        field_name = keyset_field.lstrip("-")
+        queryset = queryset.order_by(keyset_field)
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        if cursor:
+            lookup = "lt" if keyset_field.startswith("-") else "gt"
+            try:
+                queryset = queryset.filter(**{field_name + "__" + lookup: cursor})
+            except (ValueError, ValidationError):
+                raise Http404(_("Invalid cursor (%(cursor)s)") % {"cursor": cursor})
+        object_list = queryset[:page_size]
+        if len(object_list) == page_size:
+            next_cursor = getattr(object_list[page_size - 1], field_name)
+        else:
+            next_cursor = None
+        return {
+            "paginator": None,
+            "page_obj": None,
+            "is_paginated": bool(cursor) or next_cursor is not None,
+            "object_list": object_list,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
+        }
+
+
+class ModelFormSetMixin(
+    FormSetPaginationMixin, BaseModelFormSetFactory, FormSetMixin, MultipleObjectMixin
+):
     """
     A view mixin that provides a way to show and handle a single model formset
     in a request.
@@ -134,17 +1181,88 @@ class ModelFormSetMixin(FormSetMixin, MultipleObjectMixin):
     Uses `modelformset_factory`.
     """
 
-    exclude = None
-    fields = None
+    object_list = None
+    bulk_save = False
+
+    def get_formset_mixins(self):
+        """
+        Returns the mixins added to the formset class for the options enabled on
+        this view.
+
+        A paginated formset only accepts the instances of its page, so that a row
+        that moved to another page since it was rendered is an error rather than
+        being skipped.
+        """
+        mixins = super().get_formset_mixins()
+        if self.object_list is None:
+            self.object_list = self.get_formset_queryset()
+        if self.formset_pagination is not None and WindowFormSetMixin not in mixins:
+            mixins.append(WindowFormSetMixin)
+        return mixins
 
     def get_formset_kwargs(self):
         """
         Returns the keyword arguments for instantiating the formset.
         """
         kwargs = super().get_formset_kwargs()
-        kwargs["queryset"] = self.get_queryset()
+        if self.object_list is None:
+            self.object_list = self.get_formset_queryset()
+        kwargs["queryset"] = self.object_list
+        if self.formset_pagination is not None:
+            kwargs["window"] = self.object_list
         return kwargs
 
+    def get_formset_cache_models(self):
+        """
+        Returns the models whose changes invalidate the cached formset.
+        """
+        return super().get_formset_cache_models() + [self.get_queryset().model]
+
+    def get_formset_queryset(self):
+        """
+        Returns the queryset of the instances edited by the formset.
+
+        The queryset is ordered by primary key if it isn't ordered, as the formset
+        would otherwise order a copy of it. If `paginate_formset` is set and the view
+        is paginated, this is only the current page of `get_queryset()`.
+        """
+        queryset = self.get_queryset()
+        if not queryset.ordered:
+            queryset = queryset.order_by(queryset.model._meta.pk.name)
+        page_size = self.get_paginate_by(queryset) if self.paginate_formset else None
+        if not page_size:
+            return queryset
+        return self.paginate_formset_queryset(queryset, page_size)
+
+    def paginate_formset_pages(self, queryset, page_size):
+        """
+        Returns the pagination context for the page of `queryset` given in
+        `page_kwarg`.
+        """
+        paginator, page, object_list, is_paginated = self.paginate_queryset(
+            queryset, page_size
+        )
+        return {
+            "paginator": paginator,
+            "page_obj": page,
+            "is_paginated": is_paginated,
+            "object_list": object_list,
+        }
+
+    def get_context_data(self, **kwargs):
+        """
+        Adds the formset's pagination to the context when the formset is paginated.
+        """
+        if self.formset_pagination is None:
+            return super().get_context_data(**kwargs)
+        context = self.formset_pagination.copy()
+        context_object_name = self.get_context_object_name(context["object_list"])
+        if context_object_name is not None:
+            context[context_object_name] = context["object_list"]
+        context.update(kwargs)
+        # Skip MultipleObjectMixin, which would paginate the current page again.
+        return super(MultipleObjectMixin, self).get_context_data(**context)
+
     def get_factory_kwargs(self):
         """
         Returns the keyword arguments for calling the formset factory
@@ -161,17 +1279,22 @@ class ModelFormSetMixin(FormSetMixin, MultipleObjectMixin):
         """
         Returns the formset class from the model formset factory
         """
-        return modelformset_factory(self.model, **self.get_factory_kwargs())
+        return self.build_formset_class(
+            modelformset_factory, self.model, **self.get_factory_kwargs()
+        )
 
     def formset_valid(self, formset):
         """
         If the formset is valid, save the associated models.
         """
-        self.object_list = formset.save()
+        object_list = save_formset(formset, self.bulk_save)
+        if object_list is None:
+            return self.formset_invalid(formset)
+        self.object_list = object_list
         return super().formset_valid(formset)
 
 
-class BaseInlineFormSetFactory(BaseFormSetFactory):
+class BaseInlineFormSetFactory(BaseModelFormSetFactory):
     """
     Base class for constructing a FormSet from `inlineformset_factory` in a view.
 
@@ -180,8 +1303,7 @@ class BaseInlineFormSetFactory(BaseFormSetFactory):
 
     model = None
     inline_model = None
-    exclude = None
-    fields = None
+    lazy = False
 
     def get_inline_model(self):
         """
@@ -189,14 +1311,116 @@ class BaseInlineFormSetFactory(BaseFormSetFactory):
         """
         return self.inline_model
 
+    def get_formset_mixins(self):
+        """
+        Returns the mixins added to the formset class for the options enabled on
+        this view.
+        """
+        mixins = super().get_formset_mixins()
+        if self.get_prefetched_queryset() is not None:
+            mixins.append(WindowFormSetMixin)
+        return mixins
+
+    def get_formset_prefix(self):
+        """
+        Returns the prefix of the formset, which is its default prefix if `prefix`
+        isn't set.
+        """
+        return self.get_prefix() or self.get_formset().get_default_prefix()
+
+    def is_submitted(self):
+        """
+        Returns whether the formset is bound to the data of the request. A `lazy`
+        inline is only bound if its management form was submitted.
+        """
+        if not super().is_submitted():
+            return False
+        if not self.lazy:
+            return True
+        return (
+            "%s-%s" % (self.get_formset_prefix(), TOTAL_FORM_COUNT) in self.request.POST
+        )
+
     def get_formset_kwargs(self):
         """
         Returns the keyword arguments for instantiating the formset.
         """
         kwargs = super().get_formset_kwargs()
         kwargs["instance"] = self.object
+        prefetched_queryset = self.get_prefetched_queryset()
+        if prefetched_queryset is not None:
+            kwargs["window"] = prefetched_queryset
         return kwargs
 
+    def get_foreign_key(self):
+        """
+        Returns the foreign key from the inline model to the parent model.
+        """
+        return _get_foreign_key(
+            self.model,
+            self.get_inline_model(),
+            fk_name=self.get_factory_kwargs().get("fk_name"),
+        )
+
+    def get_related_name(self):
+        """
+        Returns the name of the related instances on the parent model, or `None` if
+        they have none.
+        """
+        if "_related_name" not in self.__dict__:
+            self._related_name = self.get_foreign_key().remote_field.get_accessor_name()
+        return self._related_name
+
+    def get_inline_queryset(self):
+        """
+        Returns the queryset of the inline model given as `queryset` in
+        `formset_kwargs`, or all its instances, ordered by primary key if it isn't
+        ordered.
+        """
+        queryset = self.formset_kwargs.get("queryset")
+        if queryset is None:
+            queryset = self.get_inline_model()._default_manager.all()
+        if not queryset.ordered:
+            queryset = queryset.order_by(queryset.model._meta.pk.name)
+        return queryset
+
+    def get_related_queryset(self):
+        """
+        Returns the queryset of all the instances related to the object.
+        """
+        return self.get_inline_queryset().filter(
+            **{self.get_foreign_key().name: self.object}
+        )
+
+    def get_prefetch(self):
+        """
+        Returns the `Prefetch` that loads the related instances along with the
+        object, or `None` if they can't be prefetched.
+
+        Formsets whose `formset_class` overrides `get_queryset()` aren't prefetched,
+        since their instances may not be those of `get_inline_queryset()`.
+        """
+        if "_prefetch" not in self.__dict__:
+            related_name = self.get_related_name()
+            formset_class = self.get_factory_kwargs().get("formset", BaseInlineFormSet)
+            if (
+                related_name is None
+                or formset_class.get_queryset is not BaseModelFormSet.get_queryset
+            ):
+                self._prefetch = None
+            else:
+                self._prefetch = Prefetch(
+                    related_name, queryset=self.get_inline_queryset()
+                )
+        return self._prefetch
+
+    def get_prefetched_queryset(self):
+        """
+        Returns the related instances of the object if the view prefetched them with
+        `get_prefetch()`, or `None`.
+        """
+        return None
+
     def get_factory_kwargs(self):
         """
         Returns the keyword arguments for calling the formset factory
@@ -213,23 +1437,118 @@ class BaseInlineFormSetFactory(BaseFormSetFactory):
         """
         Returns the formset class from the inline formset factory
         """
-        return inlineformset_factory(
-            self.model, self.get_inline_model(), **self.get_factory_kwargs()
+        return self.build_formset_class(
+            inlineformset_factory,
+            self.model,
+            self.get_inline_model(),
+            **self.get_factory_kwargs()
         )
 
 
-class InlineFormSetMixin(BaseInlineFormSetFactory, SingleObjectMixin, FormSetMixin):
+class InlineFormSetMixin(
+    FormSetPaginationMixin, BaseInlineFormSetFactory, SingleObjectMixin, FormSetMixin
+):
     """
     A view mixin that provides a way to show and handle a single inline formset
     in a request.
+
+    If `paginate_formset` and `paginate_by` are set, the formset only edits the
+    current page of the related instances.
     """
 
+    bulk_save = False
+    paginate_by = None
+    page_kwarg = "page"
+
+    def get_formset_mixins(self):
+        """
+        Returns the mixins added to the formset class for the options enabled on
+        this view.
+        """
+        mixins = super().get_formset_mixins()
+        if (
+            self.paginate_formset
+            and self.paginate_by
+            and WindowFormSetMixin not in mixins
+        ):
+            mixins.append(WindowFormSetMixin)
+        return mixins
+
+    def get_formset_kwargs(self):
+        """
+        Returns the keyword arguments for instantiating the formset.
+        """
+        kwargs = super().get_formset_kwargs()
+        if self.paginate_formset and self.paginate_by:
+            kwargs["window"] = self.get_formset_queryset()
+        return kwargs
+
+    def get_formset_queryset(self):
+        """
+        Returns the current page of the related instances, and adds their total
+        `count` to the pagination context.
+        """
+        queryset = self.get_related_queryset()
+        object_list = self.paginate_formset_queryset(queryset, self.paginate_by)
+        paginator = self.formset_pagination["paginator"]
+        self.formset_pagination["count"] = (
+            paginator.count if paginator is not None else queryset.count()
+        )
+        return object_list
+
+    def paginate_formset_pages(self, queryset, page_size):
+        """
+        Returns the pagination context for the page of `queryset` given in
+        `page_kwarg`.
+        """
+        paginator = Paginator(queryset, page_size)
+        page_number = (
+            self.kwargs.get(self.page_kwarg)
+            or self.request.GET.get(self.page_kwarg)
+            or 1
+        )
+        if page_number == "last":
+            page_number = paginator.num_pages
+        try:
+            page = paginator.page(page_number)
+        except InvalidPage as e:
+            raise Http404(
+                _("Invalid page (%(page_number)s): %(message)s")
+                % {"page_number": page_number, "message": str(e)}
+            )
+        return {
+            "paginator": paginator,
+            "page_obj": page,
+            "is_paginated": page.has_other_pages(),
+            "object_list": page.object_list,
+        }
+
+    def get_context_data(self, **kwargs):
+        """
+        Adds the formset's pagination to the context when the formset is paginated.
+        """
+        if self.formset_pagination is not None:
+            kwargs = dict(self.formset_pagination, **kwargs)
+        return super().get_context_data(**kwargs)
+
+    def get_formset_cache_models(self):
+        """
+        Returns the models whose changes invalidate the cached formset.
+        """
+        return super().get_formset_cache_models() + [
+            self.model,
+            self.get_inline_model(),
+        ]
+
     def formset_valid(self, formset):
-        self.object_list = formset.save()
+        object_list = save_formset(formset, self.bulk_save)
+        if object_list is None:
+            return self.formset_invalid(formset)
+        self.object_list = object_list
         return super().formset_valid(formset)
 
 
-class ProcessFormSetView(View):
+class ProcessFormSetView(ConditionalGetMixin, PartialRenderMixin, View):
     """
     A mixin that processes a formset on POST.
     """
@@ -238,7 +1557,14 @@ class ProcessFormSetView(View):
         """
         Handles GET requests and instantiates a blank version of the formset.
         """
+        prefix = self.get_partial_prefix()
+        if prefix is not None:
+            return self.render_partial_response(prefix)
+        if self.cache_formset and not self.stream_formset:
+            return self.render_to_response(self.get_cached_formset_context_data())
         formset = self.construct_formset()
+        if self.stream_formset:
+            return self.render_to_streaming_response(formset)
         return self.render_to_response(self.get_context_data(formset=formset))
 
     def post(self, request, *args, **kwargs):
@@ -246,6 +1572,9 @@ class ProcessFormSetView(View):
         Handles POST requests, instantiating a formset instance with the passed
         POST variables and then checked for validity.
         """
+        prefix = self.get_partial_prefix()
+        if prefix is not None:
+            return self.render_partial_response(prefix)
         formset = self.construct_formset()
         if formset.is_valid():
             return self.formset_valid(formset)
@@ -258,6 +1587,62 @@ class ProcessFormSetView(View):
         return self.post(*args, **kwargs)
 
 
+class AsyncSingleObjectMixin(object):
+    """
+    A mixin for the async views of a single object, which looks it up with the async
+    ORM.
+    """
+
+    async def aget_object(self, queryset=None):
+        """
+        Returns the object the view is displaying, found like `get_object()` does
+        but with `QuerySet.aget()`.
+
+        If `get_object()` is overridden, it is called from a worker thread instead
+        so that the override is respected.
+        """
+        if type(self).get_object is not SingleObjectMixin.get_object:
+            return await sync_to_async(self.get_object)(queryset)
+        if queryset is None:
+            queryset = self.get_queryset()
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        slug = self.kwargs.get(self.slug_url_kwarg)
+        if pk is not None:
+            queryset = queryset.filter(pk=pk)
+        if slug is not None and (pk is None or self.query_pk_and_slug):
+            queryset = queryset.filter(**{self.get_slug_field(): slug})
+        if pk is None and slug is None:
+            raise AttributeError(
+                "Generic detail view %s must be called with either an object "
+                "pk or a slug in the URLconf." % self.__class__.__name__
+            )
+        try:
+            return await queryset.aget()
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                _("No %(verbose_name)s found matching the query")
+                % {"verbose_name": queryset.model._meta.verbose_name}
+            )
+
+
+class AsyncProcessFormSetView(ProcessFormSetView):
+    """
+    An async version of `ProcessFormSetView`, for projects served with ASGI.
+
+    Requires Django 4.1 or later. Django forms have no async API, so the formset is
+    built, validated and saved in a single call to a worker thread.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return await sync_to_async(super().get)(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        return await sync_to_async(super().post)(request, *args, **kwargs)
+
+    async def put(self, *args, **kwargs):
+        return await self.post(*args, **kwargs)
+
+
 class BaseFormSetView(FormSetMixin, ProcessFormSetView):
     """
     A base view for displaying a formset
@@ -270,17 +1655,29 @@ class FormSetView(TemplateResponseMixin, BaseFormSetView):
     """
 
 
+class AsyncBaseFormSetView(FormSetMixin, AsyncProcessFormSetView):
+    """
+    An async base view for displaying a formset
+    """
+
+
+class AsyncFormSetView(TemplateResponseMixin, AsyncBaseFormSetView):
+    """
+    An async view for displaying a formset, and rendering a template response
+    """
+
+
 class BaseModelFormSetView(ModelFormSetMixin, ProcessFormSetView):
     """
     A base view for displaying a model formset
     """
 
     def get(self, request, *args, **kwargs):
-        self.object_list = self.get_queryset()
+        self.object_list = self.get_formset_queryset()
         return super().get(request, *args, **kwargs)
 
     def post(self, request, *args, **kwargs):
-        self.object_list = self.get_queryset()
+        self.object_list = self.get_formset_queryset()
         return super().post(request, *args, **kwargs)
 
 
@@ -290,6 +1687,44 @@ class ModelFormSetView(MultipleObjectTemplateResponseMixin, BaseModelFormSetView
     """
 
 
+class AsyncBaseModelFormSetView(ModelFormSetMixin, AsyncProcessFormSetView):
+    """
+    An async version of `BaseModelFormSetView`, which fetches the instances of the
+    formset with the async ORM.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = await self.aget_formset_queryset()
+        return await super().get(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        self.object_list = await self.aget_formset_queryset()
+        return await super().post(request, *args, **kwargs)
+
+    async def aget_formset_queryset(self):
+        """
+        Returns `get_formset_queryset()`, evaluated with the async ORM.
+        """
+        if self.paginate_formset:
+            # Pagination counts or fetches the instances.
+            queryset = await sync_to_async(self.get_formset_queryset)()
+        else:
+            queryset = self.get_formset_queryset()
+        if isinstance(queryset, QuerySet):
+            # Fills the result cache of the queryset, which the formset reuses.
+            async for obj in queryset:
+                pass
+        return queryset
+
+
+class AsyncModelFormSetView(
+    MultipleObjectTemplateResponseMixin, AsyncBaseModelFormSetView
+):
+    """
+    An async view for displaying a model formset, and rendering a template response
+    """
+
+
 class BaseInlineFormSetView(InlineFormSetMixin, ProcessFormSetView):
     """
     A base view for displaying an inline formset for a queryset belonging to
@@ -309,3 +1744,28 @@ class InlineFormSetView(SingleObjectTemplateResponseMixin, BaseInlineFormSetView
     """
     A view for displaying an inline formset for a queryset belonging to a parent model
     """
+
+
+class AsyncBaseInlineFormSetView(
+    AsyncSingleObjectMixin, InlineFormSetMixin, AsyncProcessFormSetView
+):
+    """
+    An async version of `BaseInlineFormSetView`.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return await super().get(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return await super().post(request, *args, **kwargs)
+
+
+class AsyncInlineFormSetView(
+    SingleObjectTemplateResponseMixin, AsyncBaseInlineFormSetView
+):
+    """
+    An async view for displaying an inline formset for a queryset belonging to a
+    parent model
+    """
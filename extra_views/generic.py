@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.forms import generic_inlineformset_factory
+from django.contrib.contenttypes.models import ContentType
 
 from extra_views.formsets import (
     BaseInlineFormSetFactory,
@@ -18,11 +19,34 @@ class BaseGenericInlineFormSetFactory(BaseInlineFormSetFactory):
         """
         Returns the final formset class from generic_inlineformset_factory.
         """
-        result = generic_inlineformset_factory(
-            self.inline_model, **self.get_factory_kwargs()
+        result = self.build_formset_class(
+            generic_inlineformset_factory,
+            self.inline_model,
+            **self.get_factory_kwargs()
         )
         return result
 
+    def get_related_name(self):
+        """
+        Returns `None`, as generic related instances aren't prefetched.
+        """
+        return None
+
+    def get_related_queryset(self):
+        """
+        Returns the queryset of all the instances related to the object.
+        """
+        kwargs = self.get_factory_kwargs()
+        content_type = ContentType.objects.get_for_model(
+            self.object, for_concrete_model=kwargs.get("for_concrete_model", True)
+        )
+        return self.get_inline_queryset().filter(
+            **{
+                kwargs.get("ct_field", "content_type"): content_type,
+                kwargs.get("fk_field", "object_id"): self.object.pk,
+            }
+        )
+
 
 class GenericInlineFormSetFactory(BaseGenericInlineFormSetFactory):
     """
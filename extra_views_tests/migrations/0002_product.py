@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("extra_views_tests", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Product",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sku", models.CharField(max_length=13, unique=True)),
+                ("name", models.CharField(max_length=255)),
+                (
+                    "order",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="products",
+                        to="extra_views_tests.order",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("order", "name")},
+            },
+        ),
+    ]
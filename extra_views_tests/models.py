@@ -39,6 +39,19 @@ class Item(models.Model):
         return "%s (%s)" % (self.name, self.sku)
 
 
+class Product(models.Model):
+    sku = models.CharField(max_length=13, unique=True)
+    name = models.CharField(max_length=255)
+    order = models.ForeignKey(Order, related_name="products", on_delete=models.CASCADE)
+    version = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = [("order", "name")]
+
+    def __str__(self):
+        return "%s (%s)" % (self.name, self.sku)
+
+
 class Contact(models.Model):
     name = models.CharField(max_length=255)
     email = models.CharField(max_length=255)
@@ -1,4 +1,7 @@
+import atexit
 import os
+import shutil
+import tempfile
 
 PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
 BASE_DIR = os.path.dirname(PROJECT_DIR)
@@ -31,6 +34,19 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# The cached formsets need a cache shared by all the processes.
+CACHE_DIR = tempfile.mkdtemp(prefix="extra_views_tests_cache_")
+atexit.register(shutil.rmtree, CACHE_DIR, ignore_errors=True)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": CACHE_DIR,
+    },
+    "local": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "dummy": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+}
+
 ROOT_URLCONF = "extra_views_tests.urls"
 
 SECRET_KEY = "something not very secret"
@@ -1,15 +1,56 @@
 import datetime
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal as D
-from unittest import expectedFailure
+from unittest import expectedFailure, mock, skipIf
 
 import django
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.messages import get_messages
-from django.core.exceptions import ImproperlyConfigured
-from django.forms import ValidationError
-from django.test import RequestFactory, TestCase
-
-from .models import Event, Item, Order, Tag
-from .views import AddressFormSetViewFormKwargs
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, RequestDataTooBig
+from django.db import DatabaseError, connection
+from django.db.models import QuerySet
+from django.forms import DateTimeField, DecimalField, ModelForm, ValidationError
+from django.forms.models import BaseInlineFormSet, inlineformset_factory
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone, translation
+
+from extra_views import CreateWithInlinesView
+from extra_views.dates import BaseCalendarMonthView
+from extra_views.formsets import BaseFormSetFactory, clear_formset_class_cache
+
+from .forms import AddressForm
+from .models import Event, Item, Order, Product, Tag
+from .views import (
+    AddressFormSetView,
+    AddressFormSetViewFormKwargs,
+    AsyncOrderUpdateView,
+    CachedItemModelFormSetView,
+    ColumnItemModelFormSetView,
+    ConditionalItemModelFormSetView,
+    FragmentCachedItemModelFormSetView,
+    ItemModelFormSetView,
+    ItemsInline,
+    LazyOrderUpdateView,
+    OrderUpdateView,
+    PrefetchedOrderUpdateView,
+    StreamedItemModelFormSetView,
+    TagsInline,
+)
+
+
+def can_return_rows_from_bulk_insert():
+    features = connection.features
+    # Named can_return_ids_from_bulk_insert before Django 3.0.
+    return getattr(
+        features,
+        "can_return_rows_from_bulk_insert",
+        getattr(features, "can_return_ids_from_bulk_insert", False),
+    )
 
 
 class FormSetViewTests(TestCase):
@@ -131,6 +172,22 @@ class FormSetViewTests(TestCase):
         self.assertTrue(initial_forms)
         self.assertTrue(initial_forms[0].empty_permitted)
 
+    def construct_formset(self, request, **initkwargs):
+        view = AddressFormSetViewFormKwargs(**initkwargs)
+        view.setup(request)
+        return view.construct_formset()
+
+    def test_post_data_is_not_copied(self):
+        request = self.factory.post("/formset/simple/", self.management_data)
+        self.assertIs(self.construct_formset(request).data, request.POST)
+
+    def test_copy_post_data(self):
+        request = self.factory.post("/formset/simple/", self.management_data)
+        data = self.construct_formset(request, copy_post_data=True).data
+        self.assertIsNot(data, request.POST)
+        self.assertEqual(data, request.POST)
+        data["form-TOTAL_FORMS"] = "3"
+
     def test_form_kwargs_are_merged(self):
         request = self.factory.get("/formset/simple/kwargs/")
         response = AddressFormSetViewFormKwargs.as_view()(request)
@@ -198,6 +255,28 @@ class ModelFormSetViewTests(TestCase):
         self.assertTrue("object_list" in res.context_data)
         self.assertEqual(len(res.context_data["object_list"]), 10)
 
+    def test_queryset_is_evaluated_once(self):
+        order = Order.objects.create(name="Dummy Order")
+        for i in range(3):
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=order
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get("/modelformset/simple/")
+            res.render()
+            object_list = list(res.context_data["object_list"])
+        item_queries = [
+            query
+            for query in queries.captured_queries
+            if 'FROM "extra_views_tests_item"' in query["sql"]
+        ]
+        self.assertEqual(len(item_queries), 1)
+        self.assertEqual(
+            [form.instance for form in res.context_data["formset"].initial_forms],
+            object_list,
+        )
+
     def test_fields_is_used(self):
         res = self.client.get("/modelformset/simple/")
         self.assertEqual(res.status_code, 200)
@@ -213,6 +292,1631 @@ class ModelFormSetViewTests(TestCase):
         self.assertNotIn("sku", fields)
 
 
+class PaginatedModelFormSetViewTests(TestCase):
+    def setUp(self):
+        order = Order.objects.create(name="Dummy Order")
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=order
+            )
+            for i in range(5)
+        ]
+
+    def get_data(self, items):
+        data = {
+            "form-TOTAL_FORMS": str(len(items)),
+            "form-INITIAL_FORMS": str(len(items)),
+            "form-MAX_NUM_FORMS": "",
+        }
+        for i, item in enumerate(items):
+            data.update(
+                {
+                    "form-%i-id" % i: item.pk,
+                    "form-%i-name" % i: "Updated",
+                    "form-%i-sku" % i: item.sku,
+                    "form-%i-price" % i: item.price,
+                    "form-%i-order" % i: item.order_id,
+                    "form-%i-status" % i: item.status,
+                }
+            )
+        return data
+
+    def test_offset_page(self):
+        res = self.client.get("/modelformset/paginated/", {"page": 2})
+        self.assertEqual(res.status_code, 200)
+        formset = res.context_data["formset"]
+        self.assertEqual(
+            [form.instance for form in formset.initial_forms], self.items[2:4]
+        )
+        self.assertEqual(list(res.context_data["object_list"]), self.items[2:4])
+        self.assertEqual(res.context_data["page_obj"].number, 2)
+        self.assertTrue(res.context_data["is_paginated"])
+
+    def test_offset_post_saves_page(self):
+        data = self.get_data(self.items[2:4])
+        res = self.client.post("/modelformset/paginated/?page=2", data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(list(Item.objects.filter(name="Updated")), self.items[2:4])
+
+    def test_offset_post_rejects_rows_outside_page(self):
+        data = self.get_data(self.items[:2])
+        res = self.client.post("/modelformset/paginated/?page=2", data)
+        self.assertEqual(res.status_code, 200)
+        formset = res.context_data["formset"]
+        self.assertEqual(list(formset.errors[0]), ["id"])
+        self.assertEqual(list(formset.errors[1]), ["id"])
+        self.assertEqual(Item.objects.count(), 5)
+        self.assertFalse(Item.objects.filter(name="Updated").exists())
+
+    def test_offset_post_rejects_rows_moved_to_another_page(self):
+        res = self.client.get("/modelformset/paginated/", {"page": 2})
+        formset = res.context_data["formset"]
+        rendered = [form.instance for form in formset.initial_forms]
+        self.assertEqual(rendered, self.items[2:4])
+        self.items[0].delete()
+        res = self.client.post(
+            "/modelformset/paginated/?page=2", self.get_data(rendered)
+        )
+        self.assertEqual(res.status_code, 200)
+        formset = res.context_data["formset"]
+        self.assertEqual(list(formset.errors[0]), ["id"])
+        self.assertEqual(formset.errors[1], {})
+        self.assertFalse(Item.objects.filter(name="Updated").exists())
+
+    def test_invalid_page(self):
+        res = self.client.get("/modelformset/paginated/", {"page": 9})
+        self.assertEqual(res.status_code, 404)
+
+    def test_keyset_page(self):
+        res = self.client.get("/modelformset/keyset/", {"after": self.items[1].pk})
+        self.assertEqual(res.status_code, 200)
+        formset = res.context_data["formset"]
+        self.assertEqual(
+            [form.instance for form in formset.initial_forms], self.items[2:4]
+        )
+        self.assertEqual(res.context_data["next_cursor"], self.items[3].pk)
+
+        res = self.client.get("/modelformset/keyset/", {"after": self.items[3].pk})
+        self.assertEqual(list(res.context_data["object_list"]), self.items[4:])
+        self.assertIsNone(res.context_data["next_cursor"])
+
+    def test_keyset_invalid_cursor(self):
+        res = self.client.get("/modelformset/keyset/", {"after": "abc"})
+        self.assertEqual(res.status_code, 404)
+
+
+class PaginatedInlineFormSetViewTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        other = Order.objects.create(name="Other Order")
+        Item.objects.create(name="Other", sku="9" * 13, price=D("9.99"), order=other)
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=self.order
+            )
+            for i in range(5)
+        ]
+
+    def get_data(self, items):
+        data = {"items-TOTAL_FORMS": str(len(items)), "items-INITIAL_FORMS": "2"}
+        for i, item in enumerate(items):
+            data.update(
+                {
+                    "items-%i-id" % i: item.pk,
+                    "items-%i-name" % i: "Updated",
+                    "items-%i-sku" % i: item.sku,
+                    "items-%i-price" % i: item.price,
+                    "items-%i-status" % i: item.status,
+                }
+            )
+        return data
+
+    def test_offset_page(self):
+        url = "/inlineformset/%i/paginated/" % self.order.pk
+        res = self.client.get(url, {"page": 2})
+        formset = res.context_data["formset"]
+        self.assertEqual(
+            [form.instance for form in formset.initial_forms], self.items[2:4]
+        )
+        self.assertEqual(res.context_data["count"], 5)
+        self.assertEqual(res.context_data["page_obj"].number, 2)
+        self.assertTrue(res.context_data["is_paginated"])
+        self.assertEqual(self.client.get(url, {"page": 9}).status_code, 404)
+
+    def test_offset_post_saves_page(self):
+        url = "/inlineformset/%i/paginated/?page=2" % self.order.pk
+        res = self.client.post(url, self.get_data(self.items[2:4]))
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(list(Item.objects.filter(name="Updated")), self.items[2:4])
+
+        self.client.post(url, self.get_data(self.items[:2]))
+        self.assertEqual(list(Item.objects.filter(name="Updated")), self.items[2:4])
+        self.assertEqual(Item.objects.count(), 6)
+
+    def test_keyset_page(self):
+        url = "/inlineformset/%i/keyset/" % self.order.pk
+        with self.assertNumQueries(3):
+            res = self.client.get(url, {"after": self.items[3].pk})
+        formset = res.context_data["formset"]
+        self.assertEqual(
+            [form.instance for form in formset.initial_forms], self.items[4:]
+        )
+        self.assertEqual(res.context_data["count"], 5)
+        self.assertIsNone(res.context_data["next_cursor"])
+
+
+class PrefetchInlinesTests(TestCase):
+    def setUp(self):
+        ContentType.objects.get_for_model(Order)
+        self.order = Order.objects.create(name="Dummy Order")
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=self.order
+            )
+            for i in range(3)
+        ]
+
+    def get_data(self, items):
+        data = {
+            "name": "Updated Order",
+            "items-TOTAL_FORMS": str(len(items)),
+            "items-INITIAL_FORMS": str(len(items)),
+            "extra_views_tests-tag-content_type-object_id-TOTAL_FORMS": "0",
+            "extra_views_tests-tag-content_type-object_id-INITIAL_FORMS": "0",
+        }
+        for i, item in enumerate(items):
+            data.update(
+                {
+                    "items-%i-id" % i: item.pk,
+                    "items-%i-name" % i: "Updated",
+                    "items-%i-sku" % i: item.sku,
+                    "items-%i-price" % i: item.price,
+                    "items-%i-status" % i: item.status,
+                }
+            )
+        return data
+
+    def test_get(self):
+        url = "/inlines/%i/prefetched/" % self.order.pk
+        with mock.patch(
+            "extra_views.formsets.inlineformset_factory", wraps=inlineformset_factory
+        ) as factory:
+            res = self.client.get(url)
+        self.assertEqual(factory.call_count, 1)
+        formset = res.context_data["inlines"][0]
+        self.assertEqual([form.instance for form in formset.initial_forms], self.items)
+
+    def test_post_saves_queries(self):
+        query_counts = []
+        for url in ["/inlines/%i/", "/inlines/%i/prefetched/"]:
+            Item.objects.update(name="Item")
+            with CaptureQueriesContext(connection) as queries:
+                res = self.client.post(url % self.order.pk, self.get_data(self.items))
+            self.assertEqual(res.status_code, 302)
+            self.assertEqual(Item.objects.filter(name="Updated").count(), 3)
+            query_counts.append(len(queries))
+        # The items are prefetched with the order, and their primary keys are looked
+        # up among them instead of with a query for each form.
+        self.assertEqual(query_counts[1], query_counts[0] - len(self.items))
+
+    def test_post(self):
+        url = "/inlines/%i/prefetched/" % self.order.pk
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(url, self.get_data(self.items))
+        self.assertEqual(res.status_code, 302)
+        item_queries = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "extra_views_tests_item"')
+        ]
+        self.assertEqual(len(item_queries), 1)
+        self.assertEqual(Item.objects.filter(name="Updated").count(), 3)
+
+    def test_inline_queryset(self):
+        class VisibleItemsInline(ItemsInline):
+            formset_kwargs = {"queryset": Item.objects.filter(status=0)}
+
+        Item.objects.filter(pk=self.items[1].pk).update(status=1)
+        views = [
+            PrefetchedOrderUpdateView.as_view(inlines=[VisibleItemsInline]),
+            OrderUpdateView.as_view(
+                inlines=[VisibleItemsInline],
+                queryset=Order.objects.prefetch_related("items"),
+            ),
+        ]
+        for view in views:
+            res = view(RequestFactory().get("/"), pk=self.order.pk)
+            formset = res.context_data["inlines"][0]
+            self.assertEqual(
+                [form.instance for form in formset.initial_forms],
+                [self.items[0], self.items[2]],
+            )
+
+    def test_formset_class_queryset(self):
+        class VisibleItemsFormSet(BaseInlineFormSet):
+            def get_queryset(self):
+                return super().get_queryset().filter(status=0)
+
+        class VisibleItemsInline(ItemsInline):
+            formset_class = VisibleItemsFormSet
+
+        Item.objects.filter(pk=self.items[1].pk).update(status=1)
+        view = PrefetchedOrderUpdateView.as_view(inlines=[VisibleItemsInline])
+        res = view(RequestFactory().get("/"), pk=self.order.pk)
+        formset = res.context_data["inlines"][0]
+        self.assertEqual(
+            [form.instance for form in formset.initial_forms],
+            [self.items[0], self.items[2]],
+        )
+        self.assertFalse(
+            hasattr(res.context_data["object"], "_prefetched_objects_cache")
+        )
+
+    def test_post_other_instance(self):
+        other = Order.objects.create(name="Other Order")
+        item = Item.objects.create(name="Other", sku="9" * 13, price=1, order=other)
+        res = self.client.post(
+            "/inlines/%i/prefetched/" % self.order.pk, self.get_data([item])
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("id", res.context_data["inlines"][0].errors[0])
+        self.assertEqual(Item.objects.get(pk=item.pk).name, "Other")
+
+
+class BulkSaveInlinesTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=self.order
+            )
+            for i in range(2)
+        ]
+
+    def get_data(self, new_items):
+        data = {
+            "name": "Updated Order",
+            "items-TOTAL_FORMS": str(len(self.items) + new_items),
+            "items-INITIAL_FORMS": str(len(self.items)),
+            "extra_views_tests-tag-content_type-object_id-TOTAL_FORMS": "0",
+            "extra_views_tests-tag-content_type-object_id-INITIAL_FORMS": "0",
+        }
+        for i in range(len(self.items) + new_items):
+            data.update(
+                {
+                    "items-%i-name" % i: "New %i" % i,
+                    "items-%i-sku" % i: "%013i" % i,
+                    "items-%i-price" % i: "9.99",
+                    "items-%i-status" % i: 0,
+                }
+            )
+        for i, item in enumerate(self.items):
+            data["items-%i-id" % i] = item.pk
+        data["items-0-DELETE"] = "on"
+        data["items-1-name"] = "Updated"
+        return data
+
+    def test_bulk_save(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(
+                "/inlines/%i/bulk/" % self.order.pk, self.get_data(20)
+            )
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Order.objects.get().name, "Updated Order")
+        self.assertEqual(Item.objects.count(), 21)
+        self.assertFalse(Item.objects.filter(pk=self.items[0].pk).exists())
+        self.assertEqual(Item.objects.get(pk=self.items[1].pk).name, "Updated")
+        inserts = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "extra_views_tests_item"')
+        ]
+        self.assertEqual(len(inserts), 1 if can_return_rows_from_bulk_insert() else 20)
+
+    def test_atomic(self):
+        with mock.patch(
+            "django.forms.models.BaseInlineFormSet.save", side_effect=DatabaseError
+        ):
+            with self.assertRaises(DatabaseError):
+                self.client.post("/inlines/%i/" % self.order.pk, self.get_data(1))
+        self.assertEqual(Order.objects.get().name, "Dummy Order")
+
+
+class SharedModelChoicesTests(TestCase):
+    def setUp(self):
+        self.orders = [Order.objects.create(name="Order %i" % i) for i in range(3)]
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=order
+            )
+            for i, order in enumerate(self.orders)
+        ]
+
+    def count_queries(self, queries, table):
+        # Counts the queries loading rows of `table`, but not the existence checks
+        # of the model validation of foreign keys.
+        return len(
+            [
+                query
+                for query in queries.captured_queries
+                if query["sql"].startswith('SELECT "%s"' % table)
+            ]
+        )
+
+    def get_data(self):
+        data = {
+            "form-TOTAL_FORMS": "3",
+            "form-INITIAL_FORMS": "3",
+            "form-MAX_NUM_FORMS": "",
+        }
+        for i, item in enumerate(self.items):
+            data.update(
+                {
+                    "form-%i-id" % i: item.pk,
+                    "form-%i-name" % i: "Updated",
+                    "form-%i-sku" % i: item.sku,
+                    "form-%i-price" % i: item.price,
+                    "form-%i-order" % i: self.orders[-1 - i].pk,
+                    "form-%i-status" % i: item.status,
+                }
+            )
+        return data
+
+    def test_render(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get("/modelformset/shared/")
+            res.render()
+        self.assertEqual(self.count_queries(queries, "extra_views_tests_order"), 1)
+        for form in res.context_data["formset"]:
+            self.assertEqual(len(form.fields["order"].choices), 4)
+        self.assertContains(res, "Order 2", count=4)
+
+    def test_validate(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post("/modelformset/shared/", self.get_data())
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(self.count_queries(queries, "extra_views_tests_order"), 1)
+        self.assertEqual(
+            [item.order for item in Item.objects.order_by("pk")],
+            self.orders[::-1],
+        )
+
+    def test_invalid_choice(self):
+        data = self.get_data()
+        data["form-1-order"] = "999"
+        res = self.client.post("/modelformset/shared/", data)
+        self.assertEqual(res.status_code, 200)
+        errors = res.context_data["formset"].errors
+        self.assertEqual(errors[0], {})
+        self.assertEqual(list(errors[1]), ["order"])
+        self.assertEqual(errors[2], {})
+
+
+class StreamedFormSetViewTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        for i in range(3):
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=self.order
+            )
+
+    def test_model_formset(self):
+        res = self.client.get("/modelformset/streamed/")
+        self.assertTrue(res.streaming)
+        with CaptureQueriesContext(connection) as queries:
+            chunks = list(res.streaming_content)
+        # The template, 2 chunks of 2 forms (3 instances and 1 extra) and the end.
+        self.assertEqual(len(chunks), 4)
+        self.assertNotIn(b"form-0-name", chunks[0])
+        self.assertIn(b'value="Item 1"', chunks[1])
+        self.assertIn(b"form-3-name", chunks[2])
+        self.assertIn(b"</html>", chunks[3])
+        self.assertTrue(
+            any("extra_views_tests_item" in q["sql"] for q in queries.captured_queries)
+        )
+
+        content = b"".join(chunks).decode()
+        self.assertEqual(content.count('name="form-TOTAL_FORMS"'), 1)
+        self.assertIn('name="form-TOTAL_FORMS" value="4"', chunks[3].decode())
+        self.assertIn('name="form-INITIAL_FORMS" value="3"', content)
+        self.assertIn('name="form-2-name" value="Item 2"', content)
+
+    def test_instances_deleted_while_streaming(self):
+        view = StreamedItemModelFormSetView()
+        view.setup(RequestFactory().get("/modelformset/streamed/"))
+        formset = view.construct_formset()
+        self.assertEqual(formset.initial_form_count(), 3)
+        Item.objects.filter(name="Item 1").delete()
+        forms = list(formset.iter_forms())
+        self.assertEqual(
+            [form.prefix for form in forms], ["form-0", "form-1", "form-2"]
+        )
+        self.assertEqual(forms[1].instance.name, "Item 2")
+        self.assertIsNone(forms[2].instance.pk)
+        management_form = str(formset.management_form)
+        self.assertIn('name="form-TOTAL_FORMS" value="3"', management_form)
+        self.assertIn('name="form-INITIAL_FORMS" value="2"', management_form)
+
+    def test_inline_formset(self):
+        res = self.client.get("/inlineformset/%i/streamed/" % self.order.pk)
+        content = b"".join(res.streaming_content).decode()
+        self.assertIn('name="items-INITIAL_FORMS" value="3"', content)
+        self.assertIn('name="items-0-name" value="Item 0"', content)
+
+    def test_post_is_not_streamed(self):
+        res = self.client.post(
+            "/modelformset/streamed/",
+            {"form-TOTAL_FORMS": "0", "form-INITIAL_FORMS": "0"},
+        )
+        self.assertFalse(res.streaming)
+
+    def test_template_without_streamed_forms(self):
+        view = StreamedItemModelFormSetView.as_view(
+            template_name="extra_views/item_formset.html"
+        )
+        with self.assertRaises(ImproperlyConfigured):
+            view(RequestFactory().get("/modelformset/streamed/"))
+
+
+class BatchedUniqueChecksTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        self.product = Product.objects.create(
+            sku="1111111111111", name="Bubble Bath", order=self.order
+        )
+
+    def test_model_formset(self):
+        data = {
+            "form-TOTAL_FORMS": "4",
+            "form-INITIAL_FORMS": "1",
+            "form-MAX_NUM_FORMS": "",
+            "form-0-id": self.product.pk,
+            "form-0-sku": self.product.sku,
+            "form-0-name": "Renamed",
+            "form-0-order": self.order.pk,
+            # Duplicate sku
+            "form-1-sku": self.product.sku,
+            "form-1-name": "Soap",
+            "form-1-order": self.order.pk,
+            # Duplicate order and name
+            "form-2-sku": "2222222222222",
+            "form-2-name": "Bubble Bath",
+            "form-2-order": self.order.pk,
+            "form-3-sku": "3333333333333",
+            "form-3-name": "Towel",
+            "form-3-order": self.order.pk,
+        }
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post("/modelformset/products/", data)
+        self.assertEqual(res.status_code, 200)
+        errors = res.context_data["formset"].errors
+        self.assertEqual(errors[0], {})
+        self.assertEqual(errors[1], {"sku": ["Product with this Sku already exists."]})
+        self.assertEqual(
+            errors[2],
+            {"__all__": ["Product with this Order and Name already exists."]},
+        )
+        self.assertEqual(errors[3], {})
+        product_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if 'FROM "extra_views_tests_product"' in query["sql"]
+        ]
+        # The formset's queryset, the validation of the primary key of form 0, and
+        # one query for the unique field and one for the unique_together.
+        self.assertEqual(len(product_queries), 4)
+        self.assertEqual(len([sql for sql in product_queries if " IN " in sql]), 2)
+
+    def test_inline_formset(self):
+        data = {
+            "products-TOTAL_FORMS": "2",
+            "products-INITIAL_FORMS": "0",
+            "products-MAX_NUM_FORMS": "",
+            "products-0-sku": "2222222222222",
+            "products-0-name": "Bubble Bath",
+            "products-1-sku": "3333333333333",
+            "products-1-name": "Towel",
+        }
+        res = self.client.post("/inlineformset/%i/products/" % self.order.pk, data)
+        self.assertEqual(res.status_code, 200)
+        errors = res.context_data["formset"].errors
+        self.assertEqual(
+            errors[0],
+            {"__all__": ["Product with this Order and Name already exists."]},
+        )
+        self.assertEqual(errors[1], {})
+
+        data["products-0-name"] = "Soap"
+        res = self.client.post("/inlineformset/%i/products/" % self.order.pk, data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(self.order.products.count(), 3)
+
+
+class SkipUnchangedFormsTests(TestCase):
+    def setUp(self):
+        order = Order.objects.create(name="Dummy Order")
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=order
+            )
+            for i in range(3)
+        ]
+
+    def get_rendered_data(self):
+        """
+        Returns the data a browser would submit for the rendered formset.
+        """
+        formset = self.client.get("/modelformset/unchanged/").context_data["formset"]
+        fields = list(formset.management_form)
+        for form in formset:
+            fields.extend(form)
+        return {
+            field.html_name: field.value()
+            for field in fields
+            if field.value() is not None and field.value() is not False
+        }
+
+    def test_unchanged_forms_are_skipped(self):
+        data = self.get_rendered_data()
+        self.assertIn("form-0-FINGERPRINT", data)
+        self.assertNotIn("form-3-FINGERPRINT", data)
+        data["form-1-name"] = "Updated"
+        data["form-2-price"] = "9.990"
+
+        res = self.client.post("/modelformset/unchanged/", data)
+        self.assertEqual(res.status_code, 200)
+        formset = res.context_data["formset"]
+        self.assertTrue(formset.forms[0].is_valid())
+        self.assertEqual(formset.forms[0].cleaned_data, {})
+        self.assertEqual(formset.forms[1].cleaned_data["name"], "Updated")
+        self.assertIn("price", formset.errors[2])
+
+        data["form-2-price"] = "9.99"
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post("/modelformset/unchanged/", data)
+        self.assertEqual(res.status_code, 302)
+        updates = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(Item.objects.values_list("name", flat=True)),
+            ["Item 0", "Updated", "Item 2"],
+        )
+
+    def test_tampered_fingerprint(self):
+        data = self.get_rendered_data()
+        data["form-0-FINGERPRINT"] = "tampered"
+        data["form-0-price"] = ""
+        res = self.client.post("/modelformset/unchanged/", data)
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("price", res.context_data["formset"].errors[0])
+
+    def test_delete_is_a_change(self):
+        data = self.get_rendered_data()
+        data["form-0-DELETE"] = "on"
+        res = self.client.post("/modelformset/unchanged/", data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Item.objects.count(), 2)
+
+
+class SparseDataTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=self.order
+            )
+            for i in range(3)
+        ]
+
+    def get_row(self, key, **values):
+        row = {
+            "name": "New",
+            "sku": "9" * 13,
+            "price": "1.00",
+            "order": self.order.pk,
+            "status": 0,
+        }
+        row.update(values)
+        return {"form-%s-%s" % (key, name): value for name, value in row.items()}
+
+    def test_model_formset(self):
+        data = self.get_row("pk-%i" % self.items[1].pk, name="Updated")
+        data.update(self.get_row(3))
+        res = self.client.post("/modelformset/sparse/", data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(
+            list(Item.objects.order_by("pk").values_list("name", flat=True)),
+            ["Item 0", "Updated", "Item 2", "New"],
+        )
+
+    def test_filled_in_forms_are_unchanged(self):
+        data = self.get_row("pk-%i" % self.items[1].pk, name="Updated")
+        data.update(self.get_row(3, price=""))
+        res = self.client.post("/modelformset/sparse/", data)
+        self.assertEqual(res.status_code, 200)
+        formset = res.context_data["formset"]
+        self.assertEqual(formset.total_form_count(), 4)
+        self.assertEqual(formset.initial_form_count(), 3)
+        self.assertTrue(formset.forms[0].unchanged)
+        self.assertEqual(formset.forms[1].cleaned_data["name"], "Updated")
+        self.assertIn("price", formset.errors[3])
+
+    def test_unknown_primary_key_is_ignored(self):
+        res = self.client.post("/modelformset/sparse/", self.get_row("pk-999"))
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Item.objects.count(), 3)
+
+    def test_formset(self):
+        data = {
+            "test_prefix-1-name": "Joe Bloggs",
+            "test_prefix-1-postcode": "",
+        }
+        res = self.client.post("/formset/sparse/", data)
+        self.assertEqual(res.status_code, 200)
+        formset = res.context_data["formset"]
+        self.assertEqual(formset.total_form_count(), 2)
+        self.assertEqual(formset.data["test_prefix-0-postcode"], "1234")
+        self.assertEqual(formset.errors[0], {})
+        self.assertIn("postcode", formset.errors[1])
+
+
+class JsonDataTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=self.order
+            )
+            for i in range(3)
+        ]
+
+    def get_row(self, **values):
+        row = {
+            "name": "New",
+            "sku": "9" * 13,
+            "price": "1.00",
+            "order": self.order.pk,
+            "status": 0,
+        }
+        row.update(values)
+        return row
+
+    def post_json(self, url, rows):
+        return self.client.post(url, json.dumps(rows), content_type="application/json")
+
+    def test_model_formset(self):
+        rows = [
+            self.get_row(),
+            self.get_row(id=self.items[1].pk, name="Updated", sku="1" * 13),
+        ]
+        res = self.post_json("/modelformset/json/", rows)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"success_url": "/modelformset/json/"})
+        self.assertEqual(
+            list(Item.objects.order_by("pk").values_list("name", flat=True)),
+            ["Item 0", "Updated", "Item 2", "New"],
+        )
+
+    def test_model_formset_errors(self):
+        rows = [
+            self.get_row(price=""),
+            self.get_row(id=self.items[0].pk, name="Updated", sku="0" * 13),
+        ]
+        res = self.post_json("/modelformset/json/", rows)
+        self.assertEqual(res.status_code, 400)
+        errors = res.json()
+        self.assertEqual(list(errors["errors"][0]), ["price"])
+        self.assertEqual(errors["errors"][0]["price"][0]["code"], "required")
+        self.assertEqual(errors["errors"][1], {})
+        self.assertEqual(errors["non_form_errors"], [])
+        self.assertEqual(Item.objects.filter(name="Updated").count(), 0)
+
+    def test_formset(self):
+        rows = [{"name": "Joe Bloggs", "postcode": "AB1 2CD"}, {"name": "Jane"}]
+        res = self.post_json("/formset/json/", rows)
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.json()["errors"][0], {})
+        self.assertIn("postcode", res.json()["errors"][1])
+
+    def test_invalid_json(self):
+        res = self.client.post("/formset/json/", "{", content_type="application/json")
+        self.assertEqual(res.status_code, 400)
+        res = self.post_json("/formset/json/", {"name": "Joe Bloggs"})
+        self.assertEqual(res.status_code, 400)
+
+    def test_invalid_values(self):
+        for value in ({"x": 1}, ["New"], [{"x": 1}]):
+            res = self.post_json("/modelformset/json/", [self.get_row(name=value)])
+            self.assertEqual(res.status_code, 400)
+        self.assertEqual(Item.objects.count(), 3)
+
+    def test_form_data(self):
+        data = {
+            "test_prefix-TOTAL_FORMS": "1",
+            "test_prefix-INITIAL_FORMS": "0",
+            "test_prefix-0-name": "Joe Bloggs",
+            "test_prefix-0-postcode": "AB1 2CD",
+        }
+        res = self.client.post("/formset/json/", data)
+        self.assertEqual(res.status_code, 302)
+
+
+@skipIf(django.VERSION < (4, 1), "Async class-based views require Django 4.1.")
+class AsyncViewTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        self.item = Item.objects.create(
+            name="Item", sku="0" * 13, price=D("9.99"), order=self.order, status=0
+        )
+
+    async def test_model_formset(self):
+        res = await self.async_client.get("/modelformset/async/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.context_data["formset"].forms), 2)
+        data = {
+            "form-TOTAL_FORMS": "1",
+            "form-INITIAL_FORMS": "1",
+            "form-0-id": self.item.pk,
+            "form-0-name": "Updated",
+            "form-0-sku": "0" * 13,
+            "form-0-price": "9.99",
+            "form-0-order": self.order.pk,
+            "form-0-status": 0,
+        }
+        res = await self.async_client.post("/modelformset/async/", data)
+        self.assertEqual(res.status_code, 302)
+        item = await Item.objects.aget(pk=self.item.pk)
+        self.assertEqual(item.name, "Updated")
+
+    async def test_inline_formset(self):
+        res = await self.async_client.get("/inlineformset/%i/async/" % self.order.pk)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.context_data["formset"].instance, self.order)
+        res = await self.async_client.get("/inlineformset/999/async/")
+        self.assertEqual(res.status_code, 404)
+
+    async def test_update_with_inlines(self):
+        data = {
+            "name": "Updated Order",
+            "items-TOTAL_FORMS": "1",
+            "items-INITIAL_FORMS": "0",
+            "items-0-name": "New Item",
+            "items-0-sku": "1" * 13,
+            "items-0-price": "1.00",
+            "items-0-status": 0,
+            "extra_views_tests-tag-content_type-object_id-TOTAL_FORMS": "0",
+            "extra_views_tests-tag-content_type-object_id-INITIAL_FORMS": "0",
+        }
+        url = "/inlines/%i/async/" % self.order.pk
+        res = await self.async_client.post(url, data)
+        self.assertEqual(res.status_code, 302)
+        order = await Order.objects.aget(pk=self.order.pk)
+        self.assertEqual(order.name, "Updated Order")
+        self.assertEqual(await order.items.acount(), 2)
+
+    async def test_object_is_looked_up_with_async_orm(self):
+        url = "/inlines/%i/async/" % self.order.pk
+        with mock.patch.object(
+            QuerySet, "aget", autospec=True, side_effect=QuerySet.aget
+        ) as aget:
+            res = await self.async_client.get(url)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.context_data["object"], self.order)
+        self.assertEqual(aget.call_count, 1)
+        res = await self.async_client.get("/inlines/999/async/")
+        self.assertEqual(res.status_code, 404)
+
+    async def test_get_object_override(self):
+        order = self.order
+
+        class OtherOrderUpdateView(AsyncOrderUpdateView):
+            def get_object(self, queryset=None):
+                return order
+
+        view = OtherOrderUpdateView.as_view()
+        res = await view(RequestFactory().get("/"), pk=999)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.context_data["object"], self.order)
+
+    def test_conditional_get(self):
+        view = AsyncOrderUpdateView.as_view(conditional_get=True)
+        with self.assertRaises(ImproperlyConfigured):
+            view(RequestFactory().get("/"), pk=self.order.pk)
+
+
+class FragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.order = Order.objects.create(name="Dummy Order")
+        Item.objects.create(
+            name="Item 0", sku="0" * 13, price=D("9.99"), order=self.order
+        )
+
+    def test_model_formset(self):
+        res = self.client.get("/modelformset/cached/")
+        self.assertContains(res, "Item 0")
+        with self.assertNumQueries(0):
+            cached = self.client.get("/modelformset/cached/")
+        self.assertEqual(cached.content, res.content)
+        self.assertContains(self.client.get("/modelformset/cached/?page=2"), "Item 0")
+
+    def test_local_cache(self):
+        view = FragmentCachedItemModelFormSetView.as_view(formset_cache_alias="local")
+        with self.assertRaises(ImproperlyConfigured):
+            view(RequestFactory().get("/modelformset/cached/"))
+
+    def test_invalidation(self):
+        self.client.get("/modelformset/cached/")
+        item = Item.objects.get()
+        item.name = "Renamed"
+        item.save()
+        res = self.client.get("/modelformset/cached/")
+        self.assertContains(res, "Renamed")
+        item.delete()
+        res = self.client.get("/modelformset/cached/")
+        self.assertNotContains(res, "Renamed")
+
+    def test_inline_formset(self):
+        url = "/inlineformset/%i/cached/" % self.order.pk
+        self.assertContains(self.client.get(url), "Item 0")
+        with self.assertNumQueries(1):
+            self.client.get(url)
+        Item.objects.create(
+            name="Item 1", sku="1" * 13, price=D("9.99"), order=self.order
+        )
+        self.assertContains(self.client.get(url), "Item 1")
+
+    def test_bulk_save(self):
+        self.client.get("/modelformset/cached/")
+        item = Item.objects.get()
+        data = {
+            "form-TOTAL_FORMS": "1",
+            "form-INITIAL_FORMS": "1",
+            "form-0-id": item.pk,
+            "form-0-name": "Bulk",
+            "form-0-sku": item.sku,
+            "form-0-price": "9.99",
+            "form-0-order": self.order.pk,
+            "form-0-status": 0,
+        }
+        self.client.post("/modelformset/bulk/", data)
+        self.assertContains(self.client.get("/modelformset/cached/"), "Bulk")
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.order = Order.objects.create(name="Dummy Order")
+        Item.objects.create(
+            name="Item 0", sku="0" * 13, price=D("9.99"), order=self.order
+        )
+
+    def test_model_formset(self):
+        res = self.client.get("/modelformset/conditional/")
+        etag = res["ETag"]
+        with self.assertNumQueries(0):
+            res = self.client.get("/modelformset/conditional/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+        Item.objects.update(name="Renamed")
+        Item.objects.get().save()
+        res = self.client.get("/modelformset/conditional/", HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(res, "Renamed")
+        self.assertNotEqual(res["ETag"], etag)
+
+    def test_not_enabled(self):
+        self.assertFalse(self.client.get("/modelformset/simple/").has_header("ETag"))
+
+    def test_inlines(self):
+        url = "/inlines/%i/conditional/" % self.order.pk
+        res = self.client.get(url)
+        etag = res["ETag"]
+        with self.assertNumQueries(1):
+            res = self.client.get(url, HTTP_IF_MODIFIED_SINCE=res["Last-Modified"])
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        Item.objects.create(
+            name="Item 1", sku="1" * 13, price=D("9.99"), order=self.order
+        )
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(res, "Item 1")
+
+    def test_calendar(self):
+        url = "/events/2012/jan/conditional/"
+        etag = self.client.get(url)["ETag"]
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+        Event.objects.create(name="Event", date=datetime.date(2012, 1, 1))
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(res, "Event")
+
+    def test_calendar_etag_changes_with_the_day(self):
+        url = "/events/2012/jan/conditional/"
+        with mock.patch.object(
+            BaseCalendarMonthView, "get_today", return_value=datetime.date(2012, 1, 1)
+        ):
+            res = self.client.get(url)
+            self.assertEqual(
+                res.context_data["calendar"][0]["date_list"][6]["today"], True
+            )
+            etag = res["ETag"]
+        with mock.patch.object(
+            BaseCalendarMonthView, "get_today", return_value=datetime.date(2012, 1, 2)
+        ):
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+
+    def test_local_cache(self):
+        view = ConditionalItemModelFormSetView.as_view(conditional_cache_alias="local")
+        with self.assertRaises(ImproperlyConfigured):
+            view(RequestFactory().get("/modelformset/conditional/"))
+
+    def test_dummy_cache(self):
+        view = ConditionalItemModelFormSetView.as_view(conditional_cache_alias="dummy")
+        with self.assertRaises(ImproperlyConfigured):
+            view(RequestFactory().get("/modelformset/conditional/"))
+
+    def test_unreadable_version(self):
+        with mock.patch.object(cache, "get", return_value=None):
+            res = self.client.get("/modelformset/conditional/")
+            self.assertFalse(res.has_header("ETag"))
+            res = self.client.get("/modelformset/conditional/", HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(res.status_code, 200)
+
+
+class OptimisticConcurrencyTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        self.products = [
+            Product.objects.create(sku=str(i) * 13, name=str(i), order=self.order)
+            for i in range(2)
+        ]
+
+    def get_products_data(self, prefix, versions, names=("0", "1")):
+        data = {prefix + "-TOTAL_FORMS": "2", prefix + "-INITIAL_FORMS": "2"}
+        for i, product in enumerate(self.products):
+            data.update(
+                {
+                    "%s-%i-id" % (prefix, i): product.pk,
+                    "%s-%i-sku" % (prefix, i): product.sku,
+                    "%s-%i-name" % (prefix, i): names[i],
+                    "%s-%i-VERSION" % (prefix, i): versions[i],
+                }
+            )
+        return data
+
+    def test_model_formset(self):
+        res = self.client.get("/modelformset/versioned/")
+        version = res.context["formset"].forms[0]["VERSION"].value()
+        data = {
+            "form-TOTAL_FORMS": "1",
+            "form-INITIAL_FORMS": "1",
+            "form-0-id": self.order.pk,
+            "form-0-name": "Renamed",
+            "form-0-VERSION": version,
+        }
+        res = self.client.post("/modelformset/versioned/", data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Order.objects.get().name, "Renamed")
+
+        data["form-0-name"] = "Stale"
+        res = self.client.post("/modelformset/versioned/", data)
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("changed or deleted by someone else", str(res.context["formset"]))
+        self.assertEqual(Order.objects.get().name, "Renamed")
+
+    def test_inline_formset(self):
+        url = "/inlineformset/%i/products/versioned/" % self.order.pk
+        res = self.client.get(url)
+        self.assertEqual(res.context["formset"].forms[1]["VERSION"].value(), "0")
+        data = self.get_products_data("products", ["0", "0"], names=["A", "1"])
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(url, data)
+        self.assertEqual(res.status_code, 302)
+        claims = [q for q in queries.captured_queries if '"version" = (' in q["sql"]]
+        self.assertEqual(len(claims), 1)
+        self.assertEqual(
+            list(Product.objects.order_by("pk").values_list("name", "version")),
+            [("A", 1), ("1", 0)],
+        )
+
+        data = self.get_products_data("products", ["0", "0"], names=["B", "C"])
+        res = self.client.post(url, data)
+        self.assertEqual(res.status_code, 200)
+        errors = res.context["formset"].errors
+        self.assertTrue(errors[0])
+        self.assertFalse(errors[1])
+        self.assertEqual(
+            list(Product.objects.order_by("pk").values_list("name", "version")),
+            [("A", 1), ("1", 0)],
+        )
+
+        # Rows changed by someone else but not by the user don't conflict.
+        Product.objects.filter(pk=self.products[1].pk).update(version=5)
+        data = self.get_products_data("products", ["1", "0"], names=["B", "1"])
+        self.assertEqual(self.client.post(url, data).status_code, 302)
+
+    def test_inlines(self):
+        url = "/inlines/%i/versioned/" % self.order.pk
+        data = self.get_products_data("products", ["0", "0"], names=["A", "1"])
+        data["name"] = "Renamed"
+        res = self.client.post(url, data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Product.objects.get(pk=self.products[0].pk).version, 1)
+
+        data["name"] = "Stale"
+        data["products-0-name"] = "B"
+        res = self.client.post(url, data)
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.context["inlines"][0].errors[0])
+        self.assertEqual(Order.objects.get().name, "Renamed")
+
+
+class SubmissionSizeTests(TestCase):
+    def test_too_many_forms(self):
+        data = {
+            "test_prefix-TOTAL_FORMS": "1028",
+            "test_prefix-INITIAL_FORMS": "0",
+            "test_prefix-0-name": "Joe Bloggs",
+        }
+        with mock.patch.object(AddressForm, "__init__") as form_init:
+            res = self.client.post("/formset/simple/kwargs/", data)
+        self.assertEqual(res.status_code, 400)
+        form_init.assert_not_called()
+
+    def test_too_many_sparse_forms(self):
+        res = self.client.post("/formset/sparse/", {"test_prefix-1027-name": "Joe"})
+        self.assertEqual(res.status_code, 400)
+
+    def test_too_many_json_rows(self):
+        res = self.client.post(
+            "/formset/json/",
+            json.dumps([{"name": "Joe"}] * 1028),
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, 400)
+
+    def test_content_length(self):
+        view = AddressFormSetView.as_view(max_content_length=100)
+        request = RequestFactory().post("/formset/simple/", {"form-0-name": "x" * 100})
+        with self.assertRaises(RequestDataTooBig):
+            view(request)
+        self.assertFalse(hasattr(request, "_post"))
+
+
+@skipIf(django.VERSION < (4, 0), "Copying fields on write requires Django 4.0.")
+class CopyOnWriteFieldsTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        for i in range(2):
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=self.order
+            )
+
+    def test_fields_are_shared(self):
+        res = self.client.get("/modelformset/cow/")
+        forms = res.context_data["formset"].forms
+        self.assertIs(forms[0].fields.peek("price"), forms[1].fields.peek("price"))
+        self.assertIs(forms[0]["order"].field, forms[1]["order"].field)
+        self.assertEqual(res.content, self.client.get("/modelformset/simple/").content)
+
+    def test_fields_are_copied_on_write(self):
+        res = self.client.get("/modelformset/cow/")
+        forms = res.context_data["formset"].forms
+        bound_field = forms[0]["name"]
+        forms[0].fields["name"].required = False
+        self.assertFalse(forms[0]["name"].field.required)
+        self.assertIsNot(forms[0]["name"], bound_field)
+        self.assertTrue(forms[1]["name"].field.required)
+        self.assertTrue(forms[1].fields["name"].required)
+        form_class = res.context_data["formset"].form
+        self.assertTrue(form_class.base_fields["name"].required)
+
+    def test_post(self):
+        item = Item.objects.first()
+        data = {
+            "form-TOTAL_FORMS": "1",
+            "form-INITIAL_FORMS": "1",
+            "form-0-id": item.pk,
+            "form-0-name": "Updated",
+            "form-0-sku": item.sku,
+            "form-0-price": "",
+            "form-0-order": self.order.pk,
+            "form-0-status": 0,
+        }
+        res = self.client.post("/modelformset/cow/", data)
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("price", res.context_data["formset"].errors[0])
+        data["form-0-price"] = "1.00"
+        res = self.client.post("/modelformset/cow/", data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Item.objects.get(pk=item.pk).name, "Updated")
+
+
+@skipIf(django.VERSION >= (4, 0), "Copying fields on write requires Django 4.0.")
+class CopyOnWriteFieldsUnsupportedTests(TestCase):
+    def test_improperly_configured(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self.client.get("/modelformset/cow/")
+
+
+class ColumnCleanTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+
+    def get_data(self, prices):
+        data = {"form-TOTAL_FORMS": str(len(prices)), "form-INITIAL_FORMS": "0"}
+        for i, price in enumerate(prices):
+            data.update(
+                {
+                    "form-%i-name" % i: "Item %i" % i,
+                    "form-%i-sku" % i: str(i) * 13,
+                    "form-%i-price" % i: price,
+                    "form-%i-order" % i: self.order.pk,
+                    "form-%i-status" % i: 0,
+                }
+            )
+        return data
+
+    def test_valid(self):
+        data = self.get_data(["9.99", "1.00", "9.99"])
+        res = self.client.post("/modelformset/columns/", data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(
+            list(Item.objects.order_by("pk").values_list("price", flat=True)),
+            [D("9.99"), D("1.00"), D("9.99")],
+        )
+
+    def test_errors(self):
+        prices = ["9.99", "abc", "", "1.001", "9.99"]
+        res = self.client.post("/modelformset/columns/", self.get_data(prices))
+        self.assertEqual(res.status_code, 200)
+        errors = res.context_data["formset"].errors
+        self.assertEqual(
+            [error["price"].as_data()[0].code if error else None for error in errors],
+            [None, "invalid", "required", "max_decimal_places", None],
+        )
+        self.assertEqual(Item.objects.count(), 0)
+
+    def test_clean_methods_see_all_fields(self):
+        class PriceCheckingItemForm(ModelForm):
+            class Meta:
+                model = Item
+                fields = ["name", "sku", "price", "order", "status"]
+
+            def clean_name(self):
+                if "price" in self.fields:
+                    self.add_error("price", "Checked by clean_name().")
+                return self.cleaned_data["name"]
+
+        view = ColumnItemModelFormSetView.as_view(form_class=PriceCheckingItemForm)
+        res = view(RequestFactory().post("/", self.get_data(["9.99"])))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            res.context_data["formset"].errors,
+            [{"price": ["Checked by clean_name()."]}],
+        )
+
+    def test_values_are_cleaned_once(self):
+        clean = DecimalField.clean
+        with mock.patch.object(
+            DecimalField, "clean", autospec=True, side_effect=clean
+        ) as mock_clean:
+            res = self.client.post(
+                "/modelformset/columns/", self.get_data(["9.99", "1.00", "9.99"])
+            )
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(mock_clean.call_count, 2)
+
+
+class ParallelCleanTests(TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+        self.data = {"form-TOTAL_FORMS": "3", "form-INITIAL_FORMS": "0"}
+        for i, postcode in enumerate(["AB1 2CD", "", "EF3 4GH"]):
+            self.data["form-%i-name" % i] = "Joe Bloggs"
+            self.data["form-%i-postcode" % i] = postcode
+
+    def construct_formset(self):
+        view = AddressFormSetView(clean_executor=self.executor)
+        view.setup(RequestFactory().post("/formset/simple/", self.data))
+        return view.construct_formset()
+
+    def test_forms_are_cleaned_on_executor(self):
+        thread_ids = []
+
+        def clean(form):
+            thread_ids.append(threading.get_ident())
+            return form.cleaned_data
+
+        formset = self.construct_formset()
+        with mock.patch.object(AddressForm, "clean", autospec=True, side_effect=clean):
+            self.assertFalse(formset.is_valid())
+        self.assertEqual(len(thread_ids), 3)
+        self.assertNotIn(threading.get_ident(), thread_ids)
+        self.assertEqual(formset.errors[0], {})
+        self.assertEqual(list(formset.errors[1]), ["postcode"])
+        self.assertEqual(formset.errors[2], {})
+
+    def test_speedup(self):
+        # A benchmark of forms whose clean() waits on I/O, cleaned one after the
+        # other and then on an executor with as many workers as there are forms.
+        forms = 8
+        data = {"form-TOTAL_FORMS": str(forms), "form-INITIAL_FORMS": "0"}
+        for i in range(forms):
+            data["form-%i-name" % i] = "Joe Bloggs"
+            data["form-%i-postcode" % i] = "AB1 2CD"
+
+        def clean(form):
+            time.sleep(0.05)
+            return form.cleaned_data
+
+        executor = ThreadPoolExecutor(max_workers=forms)
+        self.addCleanup(executor.shutdown)
+        durations = []
+        for clean_executor in [None, executor]:
+            view = AddressFormSetView(clean_executor=clean_executor)
+            view.setup(RequestFactory().post("/formset/simple/", data))
+            formset = view.construct_formset()
+            with mock.patch.object(
+                AddressForm, "clean", autospec=True, side_effect=clean
+            ):
+                start = time.perf_counter()
+                self.assertTrue(formset.is_valid())
+                durations.append(time.perf_counter() - start)
+        serial, parallel = durations
+        self.assertGreaterEqual(serial, forms * 0.05)
+        self.assertLess(parallel, serial / 2)
+
+    @override_settings(USE_TZ=True)
+    def test_timezone_and_language_are_active_on_executor(self):
+        results = []
+
+        def clean(form):
+            value = DateTimeField().clean("2020-01-01 10:00")
+            results.append((value, translation.get_language()))
+            return form.cleaned_data
+
+        formset = self.construct_formset()
+        with timezone.override("Asia/Tokyo"), translation.override("de"):
+            with mock.patch.object(
+                AddressForm, "clean", autospec=True, side_effect=clean
+            ):
+                formset.is_valid()
+        value = datetime.datetime(2020, 1, 1, 1, 0, tzinfo=datetime.timezone.utc)
+        self.assertEqual(results, [(value, "de")] * 3)
+
+    def test_exceptions_are_raised(self):
+        formset = self.construct_formset()
+        with mock.patch.object(AddressForm, "clean", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                formset.is_valid()
+
+    def test_post(self):
+        view = AddressFormSetView.as_view(clean_executor=self.executor)
+        res = view(RequestFactory().post("/formset/simple/", self.data))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(list(res.context_data["formset"].errors[1]), ["postcode"])
+
+
+class ConcurrentInlinesTests(TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+        self.view = CreateWithInlinesView.as_view(
+            model=Order,
+            fields=["name"],
+            inlines=[ItemsInline, TagsInline],
+            template_name="extra_views/order_and_items.html",
+            success_url="/inlines/new/",
+            inline_executor=self.executor,
+        )
+        self.data = {
+            "name": "Dummy Order",
+            "items-TOTAL_FORMS": "1",
+            "items-INITIAL_FORMS": "0",
+            "items-0-name": "Bubble Bath",
+            "items-0-sku": "1234567890123",
+            "items-0-price": "9.99",
+            "items-0-status": 0,
+            "extra_views_tests-tag-content_type-object_id-TOTAL_FORMS": 1,
+            "extra_views_tests-tag-content_type-object_id-INITIAL_FORMS": 0,
+            "extra_views_tests-tag-content_type-object_id-0-name": "Test",
+        }
+
+    def test_inlines_are_built_on_executor(self):
+        thread_ids = []
+        construct_formset = BaseFormSetFactory.construct_formset
+
+        def construct(factory):
+            thread_ids.append(threading.get_ident())
+            return construct_formset(factory)
+
+        self.data["items-TOTAL_FORMS"] = "2"
+        self.data["items-1-name"] = "Towel"
+        with mock.patch.object(
+            BaseFormSetFactory,
+            "construct_formset",
+            autospec=True,
+            side_effect=construct,
+        ):
+            res = self.view(RequestFactory().post("/inlines/new/", self.data))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(thread_ids), 2)
+        self.assertNotIn(threading.get_ident(), thread_ids)
+        items, tags = res.context_data["inlines"]
+        self.assertEqual(items.model, Item)
+        self.assertEqual(tags.model, Tag)
+        self.assertEqual(items.errors[0], {})
+        self.assertEqual(sorted(items.errors[1]), ["price", "sku", "status"])
+
+    @override_settings(USE_TZ=True)
+    def test_timezone_and_language_are_active_on_executor(self):
+        results = []
+        construct_formset = BaseFormSetFactory.construct_formset
+
+        def construct(factory):
+            value = DateTimeField().clean("2020-01-01 10:00")
+            results.append((value, translation.get_language()))
+            return construct_formset(factory)
+
+        with timezone.override("Asia/Tokyo"), translation.override("de"):
+            with mock.patch.object(
+                BaseFormSetFactory,
+                "construct_formset",
+                autospec=True,
+                side_effect=construct,
+            ):
+                res = self.view(RequestFactory().post("/inlines/new/", self.data))
+        self.assertEqual(res.status_code, 302)
+        value = datetime.datetime(2020, 1, 1, 1, 0, tzinfo=datetime.timezone.utc)
+        self.assertEqual(results, [(value, "de")] * 2)
+
+    def test_post(self):
+        res = self.view(RequestFactory().post("/inlines/new/", self.data))
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Item.objects.get().name, "Bubble Bath")
+        self.assertEqual(Tag.objects.get().content_object, Order.objects.get())
+
+
+class LazyInlinesTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        self.data = {
+            "name": "Updated Order",
+            "items-TOTAL_FORMS": "1",
+            "items-INITIAL_FORMS": "0",
+            "items-0-name": "Bubble Bath",
+            "items-0-sku": "1234567890123",
+            "items-0-price": "9.99",
+            "items-0-status": 0,
+        }
+
+    def test_get(self):
+        view = LazyOrderUpdateView.as_view()
+        with mock.patch.object(
+            BaseFormSetFactory,
+            "construct_formset",
+            autospec=True,
+            side_effect=BaseFormSetFactory.construct_formset,
+        ) as construct_formset:
+            res = view(RequestFactory().get("/"), pk=self.order.pk)
+            self.assertEqual(construct_formset.call_count, 1)
+            res.render()
+            self.assertEqual(construct_formset.call_count, 2)
+        self.assertContains(
+            res, "extra_views_tests-tag-content_type-object_id-TOTAL_FORMS"
+        )
+
+    def test_post_without_lazy_inline(self):
+        res = self.client.post("/inlines/%i/lazy/" % self.order.pk, self.data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Order.objects.get().name, "Updated Order")
+        self.assertEqual(Item.objects.get().name, "Bubble Bath")
+        self.assertEqual(Tag.objects.count(), 0)
+
+    def test_post_with_lazy_inline(self):
+        self.data.update(
+            {
+                "extra_views_tests-tag-content_type-object_id-TOTAL_FORMS": 1,
+                "extra_views_tests-tag-content_type-object_id-INITIAL_FORMS": 0,
+                "extra_views_tests-tag-content_type-object_id-0-name": "Test",
+            }
+        )
+        res = self.client.post("/inlines/%i/lazy/" % self.order.pk, self.data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(Tag.objects.get().content_object, self.order)
+
+    def test_invalid_post_renders_lazy_inline_unbound(self):
+        del self.data["items-0-sku"]
+        res = self.client.post("/inlines/%i/lazy/" % self.order.pk, self.data)
+        self.assertEqual(res.status_code, 200)
+        items, tags = res.context["inlines"]
+        self.assertFalse(items.is_valid())
+        self.assertFalse(tags.is_bound)
+        self.assertEqual(Item.objects.count(), 0)
+
+
+class PartialRenderTests(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(name="Dummy Order")
+        self.items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=self.order
+            )
+            for i in range(2)
+        ]
+        self.url = "/inlines/%i/partial/" % self.order.pk
+
+    def test_inline(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(self.url, {"partial": "items"})
+        self.assertEqual(res.status_code, 200)
+        self.assertContains(res, 'name="items-TOTAL_FORMS"')
+        self.assertContains(res, "Item 1")
+        self.assertNotContains(res, 'name="name"')
+        self.assertNotContains(res, "extra_views_tests-tag")
+        self.assertFalse(
+            [
+                query
+                for query in queries.captured_queries
+                if "extra_views_tests_tag" in query["sql"]
+            ]
+        )
+
+    def test_inline_form(self):
+        res = self.client.get(self.url, {"partial": "items", "form": 1})
+        self.assertEqual(res.status_code, 200)
+        self.assertContains(res, 'name="items-1-name"')
+        self.assertContains(res, "Item 1")
+        self.assertNotContains(res, "items-0-")
+        self.assertNotContains(res, "items-TOTAL_FORMS")
+
+    def test_extra_form(self):
+        res = self.client.get(self.url, {"partial": "items", "form": 7})
+        self.assertEqual(res.status_code, 200)
+        self.assertContains(res, 'name="items-7-name"')
+        self.assertNotContains(res, "Item ")
+
+    def test_post_is_rendered_with_errors_and_not_saved(self):
+        data = {
+            "items-TOTAL_FORMS": "1",
+            "items-INITIAL_FORMS": "0",
+            "items-0-name": "Bubble Bath",
+            "items-0-price": "9.99",
+            "items-0-status": 0,
+        }
+        res = self.client.post(self.url + "?partial=items&form=0", data)
+        self.assertEqual(res.status_code, 200)
+        self.assertContains(res, "This field is required.")
+        data["items-0-sku"] = "1234567890123"
+        res = self.client.post(self.url + "?partial=items", data)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotContains(res, "This field is required.")
+        self.assertEqual(Item.objects.count(), 2)
+
+    def test_unknown_prefix_or_index(self):
+        res = self.client.get(self.url, {"partial": "unknown"})
+        self.assertEqual(res.status_code, 404)
+        res = self.client.get(self.url, {"partial": "items", "form": "-1"})
+        self.assertEqual(res.status_code, 404)
+        res = self.client.get(self.url, {"partial": "items", "form": "first"})
+        self.assertEqual(res.status_code, 404)
+
+    def test_partial_render_not_set(self):
+        res = self.client.get("/inlines/%i/" % self.order.pk, {"partial": "items"})
+        self.assertEqual(res.status_code, 200)
+        self.assertContains(res, 'name="name"')
+
+    def test_model_formset(self):
+        res = self.client.get("/modelformset/partial/", {"partial": "form", "form": 0})
+        self.assertEqual(res.status_code, 200)
+        self.assertContains(res, 'name="form-0-name"')
+        self.assertContains(res, "Item 0")
+        self.assertNotContains(res, "<html")
+        res = self.client.get("/modelformset/partial/", {"partial": "items"})
+        self.assertEqual(res.status_code, 404)
+
+
+class BulkSaveModelFormSetViewTests(TestCase):
+    def test_bulk_save(self):
+        order = Order.objects.create(name="Dummy Order")
+        items = [
+            Item.objects.create(
+                name="Item %i" % i, sku=str(i) * 13, price=D("9.99"), order=order
+            )
+            for i in range(3)
+        ]
+        data = {
+            "form-TOTAL_FORMS": "5",
+            "form-INITIAL_FORMS": "3",
+            "form-MAX_NUM_FORMS": "",
+        }
+        for i, item in enumerate(items):
+            data.update(
+                {
+                    "form-%i-id" % i: item.pk,
+                    "form-%i-name" % i: item.name,
+                    "form-%i-sku" % i: item.sku,
+                    "form-%i-price" % i: item.price,
+                    "form-%i-order" % i: order.pk,
+                    "form-%i-status" % i: item.status,
+                }
+            )
+        data["form-0-name"] = "Updated"
+        data["form-1-price"] = "1.50"
+        data["form-2-DELETE"] = "on"
+        for i in (3, 4):
+            data.update(
+                {
+                    "form-%i-name" % i: "New %i" % i,
+                    "form-%i-sku" % i: str(i) * 13,
+                    "form-%i-price" % i: "2.00",
+                    "form-%i-order" % i: order.pk,
+                    "form-%i-status" % i: 0,
+                }
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post("/modelformset/bulk/", data)
+        self.assertEqual(res.status_code, 302)
+
+        writes = [
+            query["sql"].split(" ", 1)[0]
+            for query in queries.captured_queries
+            if not query["sql"].startswith(("SELECT", "SAVEPOINT", "RELEASE"))
+        ]
+        inserts = ["INSERT"] if can_return_rows_from_bulk_insert() else ["INSERT"] * 2
+        self.assertEqual(sorted(writes), ["DELETE"] + inserts + ["UPDATE"])
+        self.assertEqual(
+            sorted(Item.objects.values_list("name", flat=True)),
+            ["Item 1", "New 3", "New 4", "Updated"],
+        )
+        self.assertEqual(Item.objects.get(pk=items[1].pk).price, D("1.50"))
+
+
+class FormSetClassCacheTests(TestCase):
+    def setUp(self):
+        clear_formset_class_cache()
+        self.request = RequestFactory().get("/modelformset/simple/")
+
+    def get_formset_class(self, view_class, **initkwargs):
+        view = view_class(**initkwargs)
+        view.setup(self.request)
+        return view.get_formset()
+
+    def test_uncached_by_default(self):
+        self.assertIsNot(
+            self.get_formset_class(ItemModelFormSetView),
+            self.get_formset_class(ItemModelFormSetView),
+        )
+
+    def test_class_is_reused(self):
+        self.assertIs(
+            self.get_formset_class(CachedItemModelFormSetView),
+            self.get_formset_class(CachedItemModelFormSetView),
+        )
+
+    def test_factory_kwargs_change_class(self):
+        formset_class = self.get_formset_class(CachedItemModelFormSetView)
+        other_class = self.get_formset_class(
+            CachedItemModelFormSetView, factory_kwargs={"extra": 5}
+        )
+        self.assertIsNot(formset_class, other_class)
+        self.assertEqual(other_class.extra, 5)
+
+    def test_clear(self):
+        formset_class = self.get_formset_class(CachedItemModelFormSetView)
+        clear_formset_class_cache()
+        self.assertIsNot(
+            formset_class, self.get_formset_class(CachedItemModelFormSetView)
+        )
+
+
 class InlineFormSetViewTests(TestCase):
     management_data = {
         "items-TOTAL_FORMS": "2",
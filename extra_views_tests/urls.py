@@ -6,18 +6,51 @@ from .views import (
     AddressFormSetView,
     AddressFormSetViewKwargs,
     AddressFormSetViewNamed,
+    AsyncItemModelFormSetView,
+    AsyncOrderItemFormSetView,
+    AsyncOrderUpdateView,
+    BulkItemModelFormSetView,
+    BulkOrderUpdateView,
+    ColumnItemModelFormSetView,
+    ConditionalEventCalendarView,
+    ConditionalItemModelFormSetView,
+    ConditionalOrderUpdateView,
+    CopyOnWriteItemModelFormSetView,
     EventCalendarView,
     FormAndFormSetOverrideView,
+    FragmentCachedItemModelFormSetView,
+    FragmentCachedOrderItemFormSetView,
     ItemModelFormSetExcludeView,
     ItemModelFormSetView,
+    JsonAddressFormSetView,
+    JsonItemModelFormSetView,
+    KeysetItemModelFormSetView,
+    KeysetOrderItemFormSetView,
+    LazyOrderUpdateView,
     OrderCreateNamedView,
     OrderCreateView,
     OrderItemFormSetView,
+    OrderProductsView,
     OrderTagsView,
     OrderUpdateView,
     PagedModelFormSetView,
+    PaginatedItemModelFormSetView,
+    PaginatedOrderItemFormSetView,
+    PartialItemModelFormSetView,
+    PartialOrderUpdateView,
+    PrefetchedOrderUpdateView,
+    ProductModelFormSetView,
     SearchableItemListView,
+    SharedChoicesItemModelFormSetView,
+    SkipUnchangedItemModelFormSetView,
     SortableItemListView,
+    SparseAddressFormSetView,
+    SparseItemModelFormSetView,
+    StreamedItemModelFormSetView,
+    StreamedOrderItemFormSetView,
+    VersionedOrderModelFormSetView,
+    VersionedOrderProductsView,
+    VersionedOrderUpdateView,
 )
 
 urlpatterns = [
@@ -32,19 +65,60 @@ urlpatterns = [
         "formset/simple_redirect/valid/",
         TemplateView.as_view(template_name="extra_views/success.html"),
     ),
+    path("formset/sparse/", SparseAddressFormSetView.as_view()),
+    path("formset/json/", JsonAddressFormSetView.as_view()),
     path("formset/custom/", AddressFormSetView.as_view(formset_class=AddressFormSet)),
     path("modelformset/simple/", ItemModelFormSetView.as_view()),
+    path("modelformset/shared/", SharedChoicesItemModelFormSetView.as_view()),
+    path("modelformset/streamed/", StreamedItemModelFormSetView.as_view()),
+    path("modelformset/partial/", PartialItemModelFormSetView.as_view()),
+    path("modelformset/products/", ProductModelFormSetView.as_view()),
+    path("modelformset/unchanged/", SkipUnchangedItemModelFormSetView.as_view()),
+    path("modelformset/sparse/", SparseItemModelFormSetView.as_view()),
+    path("modelformset/json/", JsonItemModelFormSetView.as_view()),
+    path("modelformset/async/", AsyncItemModelFormSetView.as_view()),
+    path("modelformset/cached/", FragmentCachedItemModelFormSetView.as_view()),
+    path("modelformset/conditional/", ConditionalItemModelFormSetView.as_view()),
+    path("modelformset/cow/", CopyOnWriteItemModelFormSetView.as_view()),
+    path("modelformset/columns/", ColumnItemModelFormSetView.as_view()),
+    path("modelformset/bulk/", BulkItemModelFormSetView.as_view()),
+    path("modelformset/versioned/", VersionedOrderModelFormSetView.as_view()),
     path("modelformset/exclude/", ItemModelFormSetExcludeView.as_view()),
     path("modelformset/custom/", FormAndFormSetOverrideView.as_view()),
     path("modelformset/paged/", PagedModelFormSetView.as_view()),
+    path("modelformset/paginated/", PaginatedItemModelFormSetView.as_view()),
+    path("modelformset/keyset/", KeysetItemModelFormSetView.as_view()),
     path("inlineformset/<int:pk>/", OrderItemFormSetView.as_view()),
+    path("inlineformset/<int:pk>/streamed/", StreamedOrderItemFormSetView.as_view()),
+    path("inlineformset/<int:pk>/products/", OrderProductsView.as_view()),
+    path("inlineformset/<int:pk>/paginated/", PaginatedOrderItemFormSetView.as_view()),
+    path("inlineformset/<int:pk>/keyset/", KeysetOrderItemFormSetView.as_view()),
+    path(
+        "inlineformset/<int:pk>/products/versioned/",
+        VersionedOrderProductsView.as_view(),
+    ),
+    path("inlineformset/<int:pk>/async/", AsyncOrderItemFormSetView.as_view()),
+    path(
+        "inlineformset/<int:pk>/cached/", FragmentCachedOrderItemFormSetView.as_view()
+    ),
     path("inlines/<int:pk>/new/", OrderCreateView.as_view()),
     path("inlines/new/", OrderCreateView.as_view()),
     path("inlines/new/named/", OrderCreateNamedView.as_view()),
     path("inlines/<int:pk>/", OrderUpdateView.as_view()),
+    path("inlines/<int:pk>/conditional/", ConditionalOrderUpdateView.as_view()),
+    path("inlines/<int:pk>/bulk/", BulkOrderUpdateView.as_view()),
+    path("inlines/<int:pk>/prefetched/", PrefetchedOrderUpdateView.as_view()),
+    path("inlines/<int:pk>/lazy/", LazyOrderUpdateView.as_view()),
+    path("inlines/<int:pk>/partial/", PartialOrderUpdateView.as_view()),
+    path("inlines/<int:pk>/versioned/", VersionedOrderUpdateView.as_view()),
+    path("inlines/<int:pk>/async/", AsyncOrderUpdateView.as_view()),
     path("genericinlineformset/<int:pk>/", OrderTagsView.as_view()),
     path("sortable/<str:flag>/", SortableItemListView.as_view()),
     path("events/<int:year>/<str:month>/", EventCalendarView.as_view()),
+    path(
+        "events/<int:year>/<str:month>/conditional/",
+        ConditionalEventCalendarView.as_view(),
+    ),
     path("searchable/", SearchableItemListView.as_view()),
     path(
         "searchable/predefined_query/",
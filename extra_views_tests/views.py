@@ -1,6 +1,9 @@
 from django.views import generic
 
 from extra_views import (
+    AsyncInlineFormSetView,
+    AsyncModelFormSetView,
+    AsyncUpdateWithInlinesView,
     CalendarMonthView,
     CreateWithInlinesView,
     FormSetSuccessMessageMixin,
@@ -18,7 +21,7 @@ from extra_views.generic import GenericInlineFormSetFactory, GenericInlineFormSe
 
 from .forms import AddressForm, ItemForm, OrderForm
 from .formsets import BaseArticleFormSet
-from .models import Event, Item, Order, Tag
+from .models import Event, Item, Order, Product, Tag
 
 
 class AddressFormSetView(FormSetSuccessMessageMixin, FormSetView):
@@ -41,6 +44,15 @@ class AddressFormSetViewKwargs(FormSetView):
     initial = [{"name": "address1"}]
 
 
+class SparseAddressFormSetView(AddressFormSetViewKwargs):
+    accept_sparse_data = True
+    initial = [{"name": "address1", "postcode": "1234"}, {"name": "address2"}]
+
+
+class JsonAddressFormSetView(AddressFormSetViewKwargs):
+    accept_json = True
+
+
 class AddressFormSetViewFormKwargs(FormSetView):
     form_class = AddressForm
     template_name = "extra_views/address_formset.html"
@@ -55,6 +67,80 @@ class ItemModelFormSetView(ModelFormSetView):
     template_name = "extra_views/item_formset.html"
 
 
+class CachedItemModelFormSetView(ItemModelFormSetView):
+    cache_formset_class = True
+
+
+class SharedChoicesItemModelFormSetView(ItemModelFormSetView):
+    share_model_choices = True
+
+
+class PartialItemModelFormSetView(ItemModelFormSetView):
+    partial_render = True
+
+
+class StreamedItemModelFormSetView(ItemModelFormSetView):
+    template_name = "extra_views/streamed_formset.html"
+    stream_formset = True
+    stream_chunk_size = 2
+
+
+class SkipUnchangedItemModelFormSetView(ItemModelFormSetView):
+    skip_unchanged_forms = True
+    factory_kwargs = {"can_delete": True}
+
+
+class SparseItemModelFormSetView(SkipUnchangedItemModelFormSetView):
+    accept_sparse_data = True
+
+
+class JsonItemModelFormSetView(ItemModelFormSetView):
+    accept_json = True
+    success_url = "/modelformset/json/"
+
+
+class FragmentCachedItemModelFormSetView(ItemModelFormSetView):
+    template_name = "extra_views/cached_formset.html"
+    cache_formset = True
+
+
+class ConditionalItemModelFormSetView(ItemModelFormSetView):
+    conditional_get = True
+
+
+class CopyOnWriteItemModelFormSetView(ItemModelFormSetView):
+    copy_fields_on_write = True
+
+
+class ColumnItemModelFormSetView(ItemModelFormSetView):
+    clean_by_column = True
+
+
+class BulkItemModelFormSetView(ItemModelFormSetView):
+    bulk_save = True
+    factory_kwargs = {"can_delete": True}
+
+
+class AsyncItemModelFormSetView(AsyncModelFormSetView):
+    model = Item
+    fields = ["name", "sku", "price", "order", "status"]
+    template_name = "extra_views/item_formset.html"
+
+
+class ProductModelFormSetView(ModelFormSetView):
+    model = Product
+    fields = ["sku", "name", "order"]
+    template_name = "extra_views/item_formset.html"
+    batch_unique_checks = True
+
+
+class VersionedOrderModelFormSetView(ModelFormSetView):
+    model = Order
+    fields = ["name"]
+    template_name = "extra_views/item_formset.html"
+    version_field = "date_modified"
+
+
 class ItemModelFormSetExcludeView(ModelFormSetView):
     model = Item
     exclude = ["sku", "price"]
@@ -81,16 +167,35 @@ class PagedModelFormSetView(ModelFormSetView):
     template_name = "extra_views/paged_formset.html"
 
 
+class PaginatedItemModelFormSetView(ItemModelFormSetView):
+    paginate_by = 2
+    paginate_formset = True
+
+
+class KeysetItemModelFormSetView(PaginatedItemModelFormSetView):
+    keyset_field = "pk"
+
+
 class ItemsInline(InlineFormSetFactory):
     model = Item
     fields = ["name", "sku", "price", "order", "status"]
 
 
+class VersionedProductsInline(InlineFormSetFactory):
+    model = Product
+    fields = ["sku", "name"]
+    version_field = "version"
+
+
 class TagsInline(GenericInlineFormSetFactory):
     model = Tag
     fields = ["name"]
 
 
+class LazyTagsInline(TagsInline):
+    lazy = True
+
+
 class OrderCreateView(SuccessMessageMixin, CreateWithInlinesView):
     model = Order
     fields = ["name"]
@@ -117,6 +222,76 @@ class OrderUpdateView(UpdateWithInlinesView):
     template_name = "extra_views/order_and_items.html"
 
 
+class VersionedOrderUpdateView(OrderUpdateView):
+    inlines = [VersionedProductsInline]
+
+
+class BulkOrderUpdateView(OrderUpdateView):
+    bulk_save = True
+
+
+class PrefetchedOrderUpdateView(OrderUpdateView):
+    prefetch_inlines = True
+
+
+class PartialOrderUpdateView(OrderUpdateView):
+    partial_render = True
+
+
+class LazyOrderUpdateView(OrderUpdateView):
+    inlines = [ItemsInline, LazyTagsInline]
+
+
+class ConditionalOrderUpdateView(OrderUpdateView):
+    conditional_get = True
+    last_modified_field = "date_modified"
+
+
+class AsyncOrderUpdateView(AsyncUpdateWithInlinesView):
+    model = Order
+    form_class = OrderForm
+    inlines = [ItemsInline, TagsInline]
+    template_name = "extra_views/order_and_items.html"
+
+
+class FragmentCachedOrderItemFormSetView(OrderItemFormSetView):
+    template_name = "extra_views/cached_formset.html"
+    cache_formset = True
+
+
+class AsyncOrderItemFormSetView(AsyncInlineFormSetView):
+    model = Order
+    fields = ["name", "sku", "price", "order", "status"]
+    inline_model = Item
+    template_name = "extra_views/inline_formset.html"
+
+
+class StreamedOrderItemFormSetView(OrderItemFormSetView):
+    template_name = "extra_views/streamed_formset.html"
+    stream_formset = True
+
+
+class OrderProductsView(InlineFormSetView):
+    model = Order
+    inline_model = Product
+    fields = ["sku", "name"]
+    template_name = "extra_views/inline_formset.html"
+    batch_unique_checks = True
+
+
+class PaginatedOrderItemFormSetView(OrderItemFormSetView):
+    paginate_by = 2
+    paginate_formset = True
+
+
+class KeysetOrderItemFormSetView(PaginatedOrderItemFormSetView):
+    keyset_field = "pk"
+
+
+class VersionedOrderProductsView(OrderProductsView):
+    version_field = "version"
+
+
 class OrderTagsView(GenericInlineFormSetView):
     model = Order
     inline_model = Tag
@@ -166,3 +341,7 @@ class SortableItemListView(SortableListMixin, generic.ListView):
             self.sort_fields_aliases = [("name", "by_name"), ("sku", "by_sku")]
             self.sort_fields = []
         return super().get(request, *args, **kwargs)
+
+
+class ConditionalEventCalendarView(EventCalendarView):
+    conditional_get = True